@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Compare sequential and concurrent tournament collection.
+
+Network and LLM calls are replaced by sleeps of a fixed latency so the
+benchmark measures the collection engine itself, not the remote services.
+
+Usage: python benchmarks/bench_collection.py [latency_seconds] [concurrency]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import data_collection
+import db_utils
+from data_collection import TournamentCollector
+
+
+class SimulatedCollector(TournamentCollector):
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def generate_search_queries(self, sport, level, count=5):
+        time.sleep(self.latency)
+        return self._generate_fallback_queries(sport, level, count)
+
+    def search_web(self, query):
+        time.sleep(self.latency)
+        return [{'title': f"{query} #{i}", 'url': f"https://example.com/{i}", 'snippet': query} for i in range(3)]
+
+    def extract_tournament_data(self, search_results, sport, level):
+        time.sleep(self.latency * len(search_results))
+        return [{
+            'tournament_name': result['title'],
+            'sport': sport,
+            'level': level,
+            'start_date': f"2030-01-{i + 1:02d}",
+            'end_date': f"2030-01-{i + 2:02d}",
+            'tournament_url': result['url'],
+            'streaming_links': 'N/A',
+            'tournament_image': '',
+            'summary': result['snippet']
+        } for i, result in enumerate(search_results)]
+
+
+def run(collector, concurrency):
+    started = time.perf_counter()
+    tournaments = collector.collect_tournaments(concurrency=concurrency)
+    return tournaments, time.perf_counter() - started
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    data_collection.REQUEST_DELAY_SECONDS = 0
+    data_collection.LLM_CACHE_ENABLED = False
+    data_collection.HTTP_CACHE_ENABLED = False
+    collector = SimulatedCollector(latency)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils.DB_PATH = Path(tmp) / "bench.db"
+        db_utils.init_database()
+
+        sequential, sequential_time = run(collector, 1)
+        concurrent, concurrent_time = run(collector, concurrency)
+        db_utils.close_connection()
+
+    print(f"Combinations:       {len(data_collection.SPORTS) * len(data_collection.LEVELS)}")
+    print(f"Simulated latency:  {latency * 1000:.0f} ms per call")
+    print(f"Sequential:         {sequential_time:.2f}s ({len(sequential)} tournaments)")
+    print(f"Concurrent ({concurrency:>3}):  {concurrent_time:.2f}s ({len(concurrent)} tournaments)")
+    print(f"Speedup:            {sequential_time / concurrent_time:.1f}x")
+    print(f"Identical results:  {sequential == concurrent}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Per-render cost of the dashboard's data work: the old list-of-dicts path
+(Python loops, set comprehensions, strptime in the fallback insights) versus
+the typed DataFrame pipeline in dashboard_data.
+
+Both sides start from rows already in memory, as they are on a cached
+rerun; building the frame is reported separately because it only happens
+once per data version.
+
+Usage: python benchmarks/bench_dashboard.py [sizes] [repeats]
+   e.g. python benchmarks/bench_dashboard.py 10000,100000,500000 5
+"""
+
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pandas as pd
+
+from dashboard_data import display_table, filter_frame, frame_insights, frame_metrics, tournament_frame
+
+SPORTS = ["Cricket", "Football", "Badminton", "Running", "Gym", "Cycling",
+          "Swimming", "Kabaddi", "Yoga", "Basketball", "Chess", "Table Tennis"]
+LEVELS = ["Corporate", "School", "College/University", "Club/Academy",
+          "District", "State", "Zonal/Regional", "National", "International"]
+SUMMARY = "Group stages followed by knockout rounds and a nationally broadcast final, open to all clubs."
+
+
+def make_rows(count):
+    first = date(2024, 1, 1)
+    return [{
+        'id': i,
+        'tournament_name': f"Tournament {i}",
+        'sport': SPORTS[i % len(SPORTS)],
+        'level': LEVELS[i % len(LEVELS)],
+        'start_date': (first + timedelta(days=i % 1500)).isoformat(),
+        'end_date': (first + timedelta(days=i % 1500 + 5)).isoformat(),
+        'tournament_url': f"https://example.org/t/{i}",
+        'streaming_links': "YouTube Live",
+        'tournament_image': None,
+        'summary': SUMMARY if i % 2 else SUMMARY[:60],
+    } for i in range(count)]
+
+
+def old_render(rows, start_from, start_to):
+    # app.py before the frame pipeline: filter, metrics, fallback insights and table by hand.
+    tournaments = [t for t in rows if start_from <= t['start_date'] <= start_to]
+    today_iso = datetime.now().date().isoformat()
+    metrics = (
+        len(tournaments),
+        sum(1 for t in tournaments if t['start_date'] > today_iso),
+        len(set(t['sport'] for t in tournaments)),
+        len(set(t['level'] for t in tournaments)),
+    )
+
+    sport_count, level_count = {}, {}
+    for tournament in tournaments:
+        sport_count[tournament['sport']] = sport_count.get(tournament['sport'], 0) + 1
+        level_count[tournament['level']] = level_count.get(tournament['level'], 0) + 1
+    upcoming = len([t for t in tournaments
+                    if datetime.strptime(t['start_date'], '%Y-%m-%d').date() > datetime.now().date()])
+
+    table = pd.DataFrame([{
+        'Tournament Name': t['tournament_name'], 'Sport': t['sport'], 'Level': t['level'],
+        'Start Date': t['start_date'], 'End Date': t['end_date'],
+        'Summary': t['summary'][:100] + '...' if len(t['summary']) > 100 else t['summary']
+    } for t in tournaments])
+    return metrics, upcoming, table
+
+
+def new_render(df, start_from, start_to):
+    filtered = filter_frame(df, start_from=start_from, start_to=start_to)
+    return frame_metrics(filtered), frame_insights(filtered), display_table(filtered)
+
+
+def timed(func, repeats):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    sizes = [int(size) for size in (sys.argv[1] if len(sys.argv) > 1 else "10000,100000,500000").split(",")]
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    start_from, start_to = "2024-06-01", "2026-06-01"
+
+    print(f"{'rows':>9} {'build frame ms':>15} {'old render ms':>14} {'frame render ms':>16} {'speedup':>8}")
+    for count in sizes:
+        rows = make_rows(count)
+        build_ms = timed(lambda: tournament_frame(rows), 1)
+        df = tournament_frame(rows)
+        old_ms = timed(lambda: old_render(rows, start_from, start_to), repeats)
+        new_ms = timed(lambda: new_render(df, start_from, start_to), repeats)
+        print(f"{count:>9} {build_ms:>15.1f} {old_ms:>14.1f} {new_ms:>16.1f} {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Per-query overhead of a fresh sqlite3 connection versus the pooled,
+tuned thread-local connection returned by db_utils.get_connection().
+
+Usage: python benchmarks/bench_db_connections.py [queries] [rows]
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import db_utils
+
+QUERY = "SELECT * FROM tournaments WHERE id = ?"
+
+
+def connect_per_query(params):
+    conn = sqlite3.connect(str(db_utils.DB_PATH))
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(row) for row in conn.execute(QUERY, params).fetchall()]
+    finally:
+        conn.close()
+
+
+def pooled(params):
+    conn = db_utils.get_connection()
+    return [dict(row) for row in conn.execute(QUERY, params).fetchall()]
+
+
+def timed(func, queries, rows):
+    started = time.perf_counter()
+    for i in range(queries):
+        func((i % rows + 1,))
+    return (time.perf_counter() - started) / queries * 1e6
+
+
+def main():
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils.DB_PATH = Path(tmp) / "bench.db"
+        db_utils.init_database()
+
+        conn = db_utils.get_connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO tournaments (tournament_name, sport, level, start_date, end_date) VALUES (?, ?, ?, ?, ?)",
+                [(f"Tournament {i}", "Cricket", f"Level {i % 9}", "2030-01-01", "2030-01-02") for i in range(rows)]
+            )
+
+        baseline = timed(connect_per_query, queries, rows)
+        tuned = timed(pooled, queries, rows)
+        db_utils.close_connection()
+
+    print(f"Queries:              {queries} ({rows} rows in table)")
+    print(f"Connect per query:    {baseline:8.1f} us/query")
+    print(f"Pooled connection:    {tuned:8.1f} us/query")
+    print(f"Speedup:              {baseline / tuned:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
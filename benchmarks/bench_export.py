@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Peak Python memory (tracemalloc) and wall time of the streaming exporters at
+growing table sizes, next to the old materialize-then-dump approach. Each
+export runs once, under tracemalloc, so the times include its overhead; pass
+--untimed-trace to time an untraced run as well (twice the work).
+
+The table is grown in place to each size in turn; a flat peak across sizes
+means memory no longer depends on row count. The old approach is only run up
+to [baseline_max] rows because its peak grows with the table.
+
+The bench database is seeded with the FTS and stats triggers dropped: they
+only slow down seeding, and the exporters read the tournaments table alone.
+
+Usage: python benchmarks/bench_export.py [sizes] [baseline_max] [--untimed-trace] [--cases=a,b]
+   e.g. python benchmarks/bench_export.py 100000,1000000 100000
+        python benchmarks/bench_export.py 1000000 0 --cases=csv,ndjson.gz
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import db_utils
+import export
+
+SUMMARY = "Group stages followed by knockout rounds and a nationally broadcast final."
+
+
+def drop_triggers(conn):
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+
+
+def grow_to(rows):
+    conn = db_utils.get_connection()
+    current = conn.execute("SELECT COUNT(*) FROM tournaments").fetchone()[0]
+    with conn:
+        conn.executemany(
+            "INSERT INTO tournaments (tournament_name, sport, level, start_date, end_date, "
+            "tournament_url, summary) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((f"Tournament {i}", "Cricket", f"Level {i % 9}", f"2030-{i % 12 + 1:02d}-01",
+              f"2030-{i % 12 + 1:02d}-05", f"https://example.org/t/{i}", SUMMARY)
+             for i in range(current, rows))
+        )
+
+
+def materialized_json(filename):
+    # export_to_json before streaming: every row as a dict, then a second list, then one json.dump.
+    tournaments = db_utils.get_all_tournaments()
+    export_data = [export._export_row(tournament) for tournament in tournaments]
+    with open(filename, 'w', encoding='utf-8') as jsonfile:
+        json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+    return True
+
+
+def measure(func, filename, untimed_trace=False):
+    untraced = None
+    if untimed_trace:
+        started = time.perf_counter()
+        func(filename)
+        untraced = time.perf_counter() - started
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(filename)
+    traced = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return traced, untraced, peak / 1024 / 1024, filename.stat().st_size / 1024 / 1024
+
+
+def main():
+    untimed_trace = "--untimed-trace" in sys.argv
+    only = [arg.split("=", 1)[1].split(",") for arg in sys.argv[1:] if arg.startswith("--cases=")]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    sizes = [int(size) for size in (args[0] if args else "100000,1000000").split(",")]
+    baseline_max = int(args[1]) if len(args) > 1 else 100000
+
+    cases = [
+        ("csv", lambda f: export.export_to_csv(str(f)), "out.csv"),
+        ("json", lambda f: export.export_to_json(str(f)), "out.json"),
+        ("ndjson", lambda f: export.export_to_ndjson(str(f)), "out.ndjson"),
+        ("ndjson.gz", lambda f: export.export_to_ndjson(str(f), compress=True), "out.ndjson.gz"),
+        ("all (one pass)", lambda f: export.export_tournaments(f.parent, f.stem), "all.csv"),
+        ("json (materialized)", materialized_json, "old.json"),
+    ]
+    if only:
+        cases = [case for case in cases if case[0] in only[0]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils.DB_PATH = Path(tmp) / "bench.db"
+        db_utils.init_database()
+        drop_triggers(db_utils.get_connection())
+
+        print(f"{'rows':>9} {'export':<20} {'traced s':>9} {'untraced s':>11} {'peak MiB':>9} {'file MiB':>9}")
+        for rows in sizes:
+            started = time.perf_counter()
+            grow_to(rows)
+            print(f"# seeded {rows} rows in {time.perf_counter() - started:.1f}s", flush=True)
+            for name, func, filename in cases:
+                if name.endswith("(materialized)") and rows > baseline_max:
+                    continue
+                traced, untraced, peak, size = measure(func, Path(tmp) / filename, untimed_trace)
+                untraced = f"{untraced:.1f}" if untraced is not None else "-"
+                print(f"{rows:>9} {name:<20} {traced:>9.1f} {untraced:>11} {peak:>9.1f} {size:>9.1f}", flush=True)
+        db_utils.close_connection()
+
+
+if __name__ == "__main__":
+    main()
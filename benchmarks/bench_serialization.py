@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Bytes and latency of large tournament payloads: FastAPI's default JSON path
+(jsonable_encoder + json.dumps) versus orjson, with and without gzip/brotli.
+
+The second table goes through the real app with a TestClient, so it includes
+routing, the read cache (warm after the first request) and the compression
+middleware; wire bytes are what the client actually downloaded.
+
+Usage: python benchmarks/bench_serialization.py [rows] [repeats]
+"""
+
+import gzip
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import db_utils
+
+SUMMARY = ("A multi-day event bringing together the strongest regional sides, with group "
+           "stages followed by knockout rounds and a final broadcast nationally. ") * 3
+
+
+def seed(rows):
+    conn = db_utils.get_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO tournaments (tournament_name, sport, level, start_date, end_date, "
+            "tournament_url, streaming_links, tournament_image, summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(f"Tournament {i}", "Cricket", f"Level {i % 9}", f"2030-{i % 12 + 1:02d}-01", f"2030-{i % 12 + 1:02d}-05",
+              f"https://example.org/t/{i}", "https://stream.example.org, https://tv.example.org",
+              f"https://example.org/img/{i}.png", SUMMARY) for i in range(rows)]
+        )
+
+
+def timed(func, repeats):
+    samples = []
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def bench_encoders(payload, repeats):
+    from fastapi.encoders import jsonable_encoder
+
+    encoders = [("jsonable_encoder + json", lambda: json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8"))]
+    try:
+        import orjson
+        encoders.append(("orjson", lambda: orjson.dumps(payload)))
+    except ImportError:
+        print("orjson not installed; skipping")
+
+    compressors = [("identity", lambda body: body), ("gzip", lambda body: gzip.compress(body, 6))]
+    try:
+        import brotli
+        compressors.append(("br", lambda body: brotli.compress(body, quality=4)))
+    except ImportError:
+        print("brotli not installed; skipping")
+
+    print(f"{'encoder':<26} {'encoding':<9} {'encode ms':>10} {'compress ms':>12} {'bytes':>11}")
+    for name, encode in encoders:
+        encode_ms, body = timed(encode, repeats)
+        for encoding, compress in compressors:
+            compress_ms, compressed = timed(lambda: compress(body), repeats)
+            print(f"{name:<26} {encoding:<9} {encode_ms:>10.1f} {compress_ms:>12.1f} {len(compressed):>11}")
+
+
+def bench_endpoint(repeats):
+    from fastapi.testclient import TestClient
+    import api
+
+    client = TestClient(api.app)
+    print(f"\n{'endpoint':<22} {'accept-encoding':<16} {'ms':>8} {'wire bytes':>11}")
+    for accept in ("identity", "gzip", "br, gzip"):
+        headers = {"Accept-Encoding": accept}
+        client.get("/tournaments/filter", headers=headers)
+        latency, response = timed(lambda: client.get("/tournaments/filter", headers=headers), repeats)
+        print(f"{'/tournaments/filter':<22} {accept:<16} {latency:>8.1f} {response.num_bytes_downloaded:>11}")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils.DB_PATH = Path(tmp) / "bench.db"
+        db_utils.init_database()
+        seed(rows)
+
+        payload = {"success": True, "tournaments": db_utils.get_tournaments_by_filter()}
+        print(f"Rows: {len(payload['tournaments'])}, median of {repeats} runs\n")
+        bench_encoders(payload, repeats)
+        bench_endpoint(repeats)
+        db_utils.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Cold-start cost of each entry point: median wall time of a fresh interpreter,
+plus a `python -X importtime` breakdown of where the import time goes and
+which heavy dependencies got loaded.
+
+Entries run in a scratch directory so `main.py init` doesn't touch the real
+database. An entry whose dependencies aren't installed is reported, not
+fatal.
+
+Usage: python benchmarks/bench_startup.py [repeats] [top]
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+SRC = ROOT / "src"
+
+# Only the collect/refresh paths should ever pull these in.
+HEAVY_MODULES = ("openai", "bs4", "dateutil", "dotenv", "requests", "pandas", "streamlit")
+
+ENTRIES = [
+    ("main.py (help)", [str(ROOT / "main.py")]),
+    ("main.py init", [str(ROOT / "main.py"), "init"]),
+    ("import api (uvicorn worker)", ["-c", "import api"]),
+    ("import export", ["-c", "import export"]),
+    ("import data_collection", ["-c", "import data_collection"]),
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def run(args, cwd, importtime=False):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+    return (time.perf_counter() - started) * 1000, result
+
+
+def parse_importtime(stderr):
+    # Returns {module: cumulative ms} for top-level imports (no indentation) and every module seen.
+    top_level = {}
+    seen = set()
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, module = match.groups()
+        seen.add(module.split(".")[0])
+        if not indent:
+            top_level[module] = int(cumulative) / 1000
+    return top_level, seen
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as cwd:
+        for label, args in ENTRIES:
+            _, result = run(args, cwd, importtime=True)
+            if result.returncode != 0 or "Traceback" in result.stderr:
+                error = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+                print(f"{label}: failed ({error[-1] if error else result.returncode})\n")
+                continue
+
+            wall = statistics.median(run(args, cwd)[0] for _ in range(repeats))
+            top_level, seen = parse_importtime(result.stderr)
+            heavy = [module for module in HEAVY_MODULES if module in seen]
+
+            print(f"{label}: {wall:.0f} ms wall (median of {repeats}), "
+                  f"{sum(top_level.values()):.0f} ms in imports")
+            print(f"  heavy modules loaded: {', '.join(heavy) or 'none'}")
+            for module, ms in sorted(top_level.items(), key=lambda item: -item[1])[:top]:
+                print(f"  {ms:>8.1f} ms  {module}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Time to first byte, total time and server peak RSS for reading every
+tournament through /tournaments/filter (whole result built in memory) versus
+/tournaments/stream (NDJSON from a server-side cursor).
+
+Each endpoint gets a fresh uvicorn process on a seeded temporary database, so
+the peak RSS (VmHWM, Linux only) belongs to that one request. The client reads
+and discards the body in 64 KiB chunks.
+
+Pages SQLite reads through mmap count toward RSS; run with SQLITE_MMAP_SIZE=0
+to see only heap growth.
+
+Usage: python benchmarks/bench_stream.py [rows] [port]
+"""
+
+import http.client
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+import db_utils
+
+SUMMARY = "Group stages followed by knockout rounds and a nationally broadcast final. " * 4
+
+SERVER = """
+import sys
+from pathlib import Path
+import db_utils
+db_utils.DB_PATH = Path(sys.argv[1])
+import api, uvicorn
+uvicorn.run(api.app, host="127.0.0.1", port=int(sys.argv[2]), log_level="warning")
+"""
+
+
+def seed(rows):
+    conn = db_utils.get_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO tournaments (tournament_name, sport, level, start_date, end_date, summary) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(f"Tournament {i}", "Cricket", f"Level {i % 9}", f"2030-{i % 12 + 1:02d}-01",
+              f"2030-{i % 12 + 1:02d}-05", SUMMARY) for i in range(rows)]
+        )
+        db_utils._bump_data_version(conn.cursor())
+
+
+def peak_rss_mib(pid):
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def wait_for_server(port):
+    for _ in range(100):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+def measure(db_path, port, path):
+    server = subprocess.Popen([sys.executable, "-c", SERVER, str(db_path), str(port)], cwd=SRC)
+    try:
+        wait_for_server(port)
+        idle = peak_rss_mib(server.pid)
+
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=300)
+        started = time.perf_counter()
+        conn.request("GET", path, headers={"Accept-Encoding": "identity"})
+        response = conn.getresponse()
+        first = response.read(1)
+        first_byte = time.perf_counter() - started
+        received = len(first)
+        while True:
+            chunk = response.read(65536)
+            if not chunk:
+                break
+            received += len(chunk)
+        total = time.perf_counter() - started
+        conn.close()
+
+        return first_byte * 1000, total * 1000, idle, peak_rss_mib(server.pid), received
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils.DB_PATH = Path(tmp) / "bench.db"
+        db_utils.init_database()
+        seed(rows)
+        db_utils.close_connection()
+
+        print(f"Rows: {rows}\n")
+        print(f"{'endpoint':<22} {'TTFB ms':>9} {'total ms':>10} {'idle MiB':>9} {'peak MiB':>9} {'bytes':>12}")
+        for path in ("/tournaments/filter", "/tournaments/stream"):
+            ttfb, total, idle, peak, received = measure(db_utils.DB_PATH, port, path)
+            print(f"{path:<22} {ttfb:>9.1f} {total:>10.1f} {idle:>9.1f} {peak:>9.1f} {received:>12}")
+
+
+if __name__ == "__main__":
+    main()
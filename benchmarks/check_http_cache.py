@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Checks CachingAdapter against a local http.server stand-in: fresh hits,
+ETag revalidation (304), no-store and the minimum-freshness floor. Each path
+counts how often the server was actually reached.
+
+Usage: python benchmarks/check_http_cache.py
+"""
+
+import sys
+import tempfile
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import requests
+
+from http_cache import CachingAdapter, HTTPCache
+
+ETAG = '"v1"'
+hits = Counter()
+
+
+class StandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        hits[self.path] += 1
+        if self.path == "/etag" and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", "0")
+            self.send_header("Connection", "keep-alive")
+            self.end_headers()
+            return
+
+        headers = {
+            "/fresh": {"Cache-Control": "max-age=60"},
+            "/etag": {"Cache-Control": "no-cache", "ETag": ETAG},
+            "/nostore": {"Cache-Control": "no-store"},
+            "/plain": {},
+        }[self.path]
+        body = f"body of {self.path} #{hits[self.path]}".encode()
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def session(tmp, name, min_fresh_seconds):
+    adapter = CachingAdapter(HTTPCache(Path(tmp) / f"{name}.db"), min_fresh_seconds=min_fresh_seconds)
+    client = requests.Session()
+    client.mount("http://", adapter)
+    return client, adapter
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client, adapter = session(tmp, "floor", min_fresh_seconds=3600)
+
+        # max-age: the second request never reaches the server
+        first, second = client.get(base + "/fresh"), client.get(base + "/fresh")
+        assert hits["/fresh"] == 1 and getattr(second, "from_cache", False)
+        assert second.text == first.text
+
+        # no-cache + ETag: revalidated with If-None-Match, 304 served with the cached body
+        first = client.get(base + "/etag")
+        for _ in range(2):
+            revalidated = client.get(base + "/etag")
+            assert revalidated.status_code == 200 and revalidated.text == first.text
+            assert revalidated.headers.get("Content-Length") is None
+            assert revalidated.headers.get("Connection") is None
+            assert revalidated.headers.get("ETag") == ETAG
+        assert hits["/etag"] == 3 and adapter.revalidated == 2
+
+        # no-store: never written, so every request goes to the server
+        client.get(base + "/nostore")
+        client.get(base + "/nostore")
+        assert hits["/nostore"] == 2 and adapter.cache.get(base + "/nostore") is None
+
+        # No freshness headers: the minimum-freshness floor alone keeps the entry fresh...
+        client.get(base + "/plain")
+        assert getattr(client.get(base + "/plain"), "from_cache", False)
+        assert hits["/plain"] == 1
+
+        # ...and without a floor the same response is refetched
+        unfloored, _ = session(tmp, "no-floor", min_fresh_seconds=0)
+        unfloored.get(base + "/plain")
+        unfloored.get(base + "/plain")
+        assert hits["/plain"] == 3
+
+        print(f"ok: {dict(hits)}, adapter {adapter.stats()}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
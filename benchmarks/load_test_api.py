@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Closed-loop load test for the FastAPI server.
+
+Each concurrency level runs that many client threads, each issuing requests
+back to back, and reports throughput with p50/p99 latency. Run it against
+the server before and after a change to compare.
+
+Usage: python benchmarks/load_test_api.py [base_url] [path] [requests_per_level] [levels]
+   e.g. python benchmarks/load_test_api.py http://localhost:8000 "/tournaments?limit=100" 2000 1,8,32,64
+"""
+
+import http.client
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_level(base_url, path, concurrency, total_requests):
+    parts = urlsplit(base_url)
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    per_client = max(total_requests // concurrency, 1)
+
+    def client():
+        nonlocal errors
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+        local = []
+        local_errors = 0
+        for _ in range(per_client):
+            started = time.perf_counter()
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 400:
+                    local_errors += 1
+            except Exception:
+                local_errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+            local.append(time.perf_counter() - started)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000
+    }
+
+
+def main():
+    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+    path = sys.argv[2] if len(sys.argv) > 2 else "/tournaments?limit=100"
+    total_requests = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+    levels = [int(level) for level in (sys.argv[4] if len(sys.argv) > 4 else "1,8,32,64").split(",")]
+
+    print(f"GET {base_url}{path}")
+    print(f"{'concurrency':>11} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for concurrency in levels:
+        result = run_level(base_url, path, concurrency, total_requests)
+        print(f"{result['concurrency']:>11} {result['requests']:>9} {result['errors']:>7} "
+              f"{result['rps']:>9.1f} {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,103 @@ CREATE TABLE tournaments (
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Streaming platforms per sport and level, shared by all tournaments
+CREATE TABLE streaming_catalog (
+    sport TEXT NOT NULL,
+    level TEXT NOT NULL,
+    platforms TEXT NOT NULL,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (sport, level)
+);
+
+-- Data version, bumped by every write so readers can invalidate caches
+CREATE TABLE db_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT INTO db_meta (key, value) VALUES ('data_version', 0);
+INSERT INTO db_meta (key, value) VALUES ('iso_dates', 1);
+INSERT INTO db_meta (key, value) VALUES ('modified_at', CAST(strftime('%s', 'now') AS INTEGER));
+
+-- Refresh jobs, shared by every API worker process; at most one may be active
+CREATE TABLE refresh_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    collected INTEGER NOT NULL DEFAULT 0,
+    ingest TEXT NOT NULL DEFAULT '{}',
+    errors TEXT NOT NULL DEFAULT '[]',
+    progress TEXT NOT NULL DEFAULT '[]',
+    heartbeat_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX idx_refresh_jobs_active
+ON refresh_jobs(status IN ('queued', 'running')) WHERE status IN ('queued', 'running');
+
 -- Indexes for performance
 CREATE INDEX idx_sport ON tournaments(sport);
 CREATE INDEX idx_level ON tournaments(level);
 CREATE INDEX idx_start_date ON tournaments(start_date);
-CREATE INDEX idx_sport_level ON tournaments(sport, level);
\ No newline at end of file
+CREATE INDEX idx_sport_level_start ON tournaments(sport, level, start_date);
+CREATE INDEX idx_last_updated ON tournaments(last_updated);
+
+-- Natural key: a refresh updates an existing tournament instead of duplicating it
+CREATE UNIQUE INDEX idx_natural_key ON tournaments(lower(trim(tournament_name)), sport, start_date);
+
+-- Full-text search over names and summaries, kept in sync by triggers
+CREATE VIRTUAL TABLE tournaments_fts USING fts5(
+    tournament_name, summary,
+    content='tournaments', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER tournaments_fts_insert AFTER INSERT ON tournaments BEGIN
+    INSERT INTO tournaments_fts(rowid, tournament_name, summary)
+    VALUES (new.id, new.tournament_name, new.summary);
+END;
+
+CREATE TRIGGER tournaments_fts_delete AFTER DELETE ON tournaments BEGIN
+    INSERT INTO tournaments_fts(tournaments_fts, rowid, tournament_name, summary)
+    VALUES ('delete', old.id, old.tournament_name, old.summary);
+END;
+
+CREATE TRIGGER tournaments_fts_update AFTER UPDATE OF tournament_name, summary ON tournaments BEGIN
+    INSERT INTO tournaments_fts(tournaments_fts, rowid, tournament_name, summary)
+    VALUES ('delete', old.id, old.tournament_name, old.summary);
+    INSERT INTO tournaments_fts(rowid, tournament_name, summary)
+    VALUES (new.id, new.tournament_name, new.summary);
+END;
+
+-- Counts per (sport, level, start month), kept exact by triggers for /stats
+CREATE TABLE tournament_counts (
+    sport TEXT NOT NULL,
+    level TEXT NOT NULL,
+    month TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (sport, level, month)
+);
+
+CREATE TRIGGER tournament_counts_insert AFTER INSERT ON tournaments BEGIN
+    INSERT INTO tournament_counts (sport, level, month, count)
+    VALUES (new.sport, new.level, substr(new.start_date, 1, 7), 1)
+    ON CONFLICT(sport, level, month) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER tournament_counts_delete AFTER DELETE ON tournaments BEGIN
+    UPDATE tournament_counts SET count = count - 1
+    WHERE sport = old.sport AND level = old.level AND month = substr(old.start_date, 1, 7);
+    DELETE FROM tournament_counts
+    WHERE sport = old.sport AND level = old.level AND month = substr(old.start_date, 1, 7) AND count <= 0;
+END;
+
+CREATE TRIGGER tournament_counts_update AFTER UPDATE OF sport, level, start_date ON tournaments BEGIN
+    UPDATE tournament_counts SET count = count - 1
+    WHERE sport = old.sport AND level = old.level AND month = substr(old.start_date, 1, 7);
+    DELETE FROM tournament_counts
+    WHERE sport = old.sport AND level = old.level AND month = substr(old.start_date, 1, 7) AND count <= 0;
+    INSERT INTO tournament_counts (sport, level, month, count)
+    VALUES (new.sport, new.level, substr(new.start_date, 1, 7), 1)
+    ON CONFLICT(sport, level, month) DO UPDATE SET count = count + 1;
+END;
\ No newline at end of file
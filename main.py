@@ -2,20 +2,89 @@
 
 import sys
 import os
-import subprocess
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from dotenv import load_dotenv
+
+SRC_DIR = Path(__file__).parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+# src modules read their settings from the environment at import time, so .env goes first.
+load_dotenv()
 
 def run_command(command):
+    # Only the streamlit command needs subprocess; keep it out of every other CLI start.
+    import subprocess
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(result.stdout)
+        # Output goes straight to the terminal so server logs show up as they happen.
+        subprocess.run(command, check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error running command: {e}")
-        print(f"Error output: {e.stderr}")
         return False
+    except KeyboardInterrupt:
+        return True
+
+def serve_api(argv):
+    import argparse
+    import importlib.util
+    
+    parser = argparse.ArgumentParser(prog="python main.py api", description="Run the FastAPI server")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("API_WORKERS", "0")),
+                        help="worker processes (0 = one per CPU core)")
+    parser.add_argument("--keep-alive", type=int, default=int(os.getenv("API_KEEP_ALIVE_SECONDS", "5")),
+                        help="seconds an idle keep-alive connection stays open")
+    parser.add_argument("--backlog", type=int, default=int(os.getenv("API_BACKLOG", "2048")),
+                        help="pending connections the listening socket queues")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.getenv("API_GRACEFUL_TIMEOUT_SECONDS", "30")),
+                        help="seconds to let in-flight requests finish on shutdown")
+    parser.add_argument("--reload", action="store_true", help="restart on code changes (single worker)")
+    args = parser.parse_args(argv)
+    
+    workers = 1 if args.reload else (args.workers or os.cpu_count() or 1)
+    
+    # Create the schema once here instead of racing it in every worker, then check that
+    # the database can take writes from several processes.
+    from db_utils import init_database, get_sqlite_settings, close_connection
+    init_database()
+    sqlite_settings = get_sqlite_settings()
+    close_connection()
+    if workers > 1 and (sqlite_settings['journal_mode'] != 'wal' or sqlite_settings['busy_timeout_ms'] <= 0):
+        print(f"⚠️  SQLite journal_mode={sqlite_settings['journal_mode']}, "
+              f"busy_timeout={sqlite_settings['busy_timeout_ms']}ms is not safe for several processes; "
+              "falling back to 1 worker")
+        workers = 1
+    
+    # uvloop/httptools are optional speedups; uvicorn's pure-Python defaults work without them.
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
+    print(f"⚙️  {workers} worker(s), loop={loop}, http={http}, keep-alive={args.keep_alive}s, "
+          f"backlog={args.backlog}, graceful shutdown={args.graceful_timeout}s")
+    
+    # 0.0.0.0 / :: listen on every interface; point people at the local one.
+    display_host = "localhost" if args.host in ("0.0.0.0", "::") else args.host
+    print("🚀 Starting FastAPI server...")
+    print(f"🌐 API will be available at http://{display_host}:{args.port}")
+    print(f"📖 API docs at http://{display_host}:{args.port}/docs")
+    print("💡 Press Ctrl+C to stop the server")
+    
+    import uvicorn
+    uvicorn.run(
+        "api:app",
+        app_dir=str(SRC_DIR),
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        reload=args.reload,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=args.keep_alive,
+        backlog=args.backlog,
+        timeout_graceful_shutdown=args.graceful_timeout
+    )
 
 def main():
     if len(sys.argv) < 2:
@@ -24,10 +93,12 @@ def main():
         print("Usage: python main.py <command>")
         print("\nCommands:")
         print("  init      - Initialize database")
-        print("  collect   - Collect tournament data")
-        print("  export    - Export data to CSV/JSON")
+        print("  collect   - Collect tournament data (optional: collect <concurrency>)")
+        print("  catalog   - Refresh streaming platform catalog (catalog --force refreshes all)")
+        print("  export    - Export data to CSV/JSON/NDJSON (export --gzip compresses the files)")
+        print("  rebuild-stats - Recompute the aggregate counts behind /stats")
         print("  streamlit - Run Streamlit app (opens in browser)")
-        print("  api       - Run FastAPI server")
+        print("  api       - Run FastAPI server (api --help lists workers, keep-alive, backlog, ...)")
         print("  help      - Show this help message")
         return
 
@@ -51,34 +122,55 @@ def main():
         print("🔍 Collecting tournament data...")
         try:
             from data_collection import collect_tournaments
-            tournaments = collect_tournaments()
+            concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else None
+            tournaments = collect_tournaments(concurrency=concurrency)
             print(f"✅ Collected {len(tournaments)} tournaments")
         except Exception as e:
             print(f"❌ Error collecting data: {e}")
             print("💡 Make sure you have set up your .env file with OPENAI_API_KEY")
         
+    elif command == "catalog":
+        print("📺 Refreshing streaming platform catalog...")
+        try:
+            from data_collection import refresh_streaming_catalog
+            refreshed = refresh_streaming_catalog(force="--force" in sys.argv[2:])
+            print(f"✅ Refreshed {refreshed} catalog entries")
+        except Exception as e:
+            print(f"❌ Error refreshing catalog: {e}")
+            print("💡 Make sure you have set up your .env file with OPENAI_API_KEY")
+        
     elif command == "export":
         print("📤 Exporting data...")
         try:
-            from export import export_to_csv, export_to_json
-            export_to_csv()
-            export_to_json()
+            from export import export_tournaments
+            # One scan of the table feeds all three files.
+            export_tournaments(compress="--gzip" in sys.argv[2:])
             print("✅ Data exported successfully!")
         except Exception as e:
             print(f"❌ Error exporting data: {e}")
         
+    elif command == "rebuild-stats":
+        print("📊 Rebuilding tournament stats...")
+        try:
+            from db_utils import rebuild_tournament_stats
+            if rebuild_tournament_stats():
+                print("✅ Tournament stats rebuilt!")
+            else:
+                print("❌ Error rebuilding stats, see log for details")
+        except Exception as e:
+            print(f"❌ Error rebuilding stats: {e}")
+        
     elif command == "streamlit":
         print("🚀 Starting Streamlit app...")
         print("🌐 The app will open in your browser at http://localhost:8501")
         print("💡 Press Ctrl+C to stop the app")
-        run_command("streamlit run src/app.py --server.port 8501")
+        run_command([sys.executable, "-m", "streamlit", "run", str(SRC_DIR / "app.py"), "--server.port", "8501"])
         
     elif command == "api":
-        print("🚀 Starting FastAPI server...")
-        print("🌐 API will be available at http://localhost:8000")
-        print("📖 API docs at http://localhost:8000/docs")
-        print("💡 Press Ctrl+C to stop the server")
-        run_command("uvicorn src.api:app --host 0.0.0.0 --port 8000 --reload")
+        try:
+            serve_api(sys.argv[2:])
+        except Exception as e:
+            print(f"❌ Error starting API server: {e}")
         
     else:
         print(f"❌ Unknown command: {command}")
@@ -1,20 +1,135 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Dict, Optional
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
 
-from db_utils import get_all_tournaments, get_tournaments_by_filter, get_tournament_stats
-from data_collection import collect_tournaments
+from dotenv import load_dotenv
+
+# Load .env before the local imports below read their settings, also when uvicorn
+# imports this module directly.
+load_dotenv()
+
+from db_utils import (
+    get_tournaments_page, get_tournaments_by_filter, get_tournament_stats,
+    search_tournaments, get_data_version, get_last_modified, TournamentStream
+)
+from query_cache import VersionedCache
+from compression import CompressionMiddleware, strip_etag_coding
+from jobs import JobManager, JobAlreadyRunningError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ORJSONResponse imports without orjson and only fails when rendering, so check for it here.
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    orjson = None
+    FastJSONResponse = JSONResponse
+
+API_DEFAULT_PAGE_SIZE = int(os.getenv('API_DEFAULT_PAGE_SIZE', '100'))
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '1000'))
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+API_CACHE_CONTROL = os.getenv('API_CACHE_CONTROL', 'no-cache')
+
 app = FastAPI(
     title="GenAI Sports Calendar API",
     description="API for managing sports tournament data using Hugging Face models",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
+read_cache = VersionedCache()
+job_manager = JobManager()
+# sqlite3 calls block, so handlers run them here instead of on the event loop.
+# Each pool thread keeps its own db_utils connection.
+db_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="db")
+
+async def run_db(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, functools.partial(func, *args, **kwargs))
+
+def cached_query(func, version: Optional[int] = None, **params):
+    # The db_utils readers raise on failure, so an error surfaces as a 500 and is never
+    # cached (or given an ETag) as an empty result for the rest of the data version.
+    if version is None:
+        version = get_data_version()
+    key = (func.__name__,) + tuple(sorted(params.items()))
+    return read_cache.get_or_load(key, version, lambda: func(**params))
+
+def _freshness():
+    version = get_data_version()
+    return version, cached_query(get_last_modified, version=version)
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # Compressed responses carry the ETag with a coding suffix (see compression.coded_etag).
+    candidates = [candidate.strip() for candidate in header.split(',')]
+    return '*' in candidates or etag in [
+        strip_etag_coding(candidate[2:] if candidate.startswith('W/') else candidate) for candidate in candidates
+    ]
+
+async def conditional_get(request: Request, response: Response):
+    """Set ETag/Last-Modified/Cache-Control on ``response`` and check the request's validators.
+
+    Returns the data version the handler should read at, and a 304 response
+    when the client's copy is current (in which case nothing else is loaded).
+    """
+    version, last_updated = await run_db(_freshness)
+    
+    query = '&'.join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    etag = '"' + hashlib.sha256(f"{version}|{request.url.path}|{query}".encode('utf-8')).hexdigest()[:32] + '"'
+    headers = {'ETag': etag, 'Cache-Control': API_CACHE_CONTROL}
+    
+    last_modified = None
+    if last_updated:
+        try:
+            last_modified = datetime.strptime(last_updated, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+            headers['Last-Modified'] = format_datetime(last_modified, usegmt=True)
+        except ValueError:
+            last_modified = None
+    
+    response.headers.update(headers)
+    
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return version, Response(status_code=304, headers=headers)
+        return version, None
+    
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified:
+        try:
+            if last_modified <= parsedate_to_datetime(if_modified_since):
+                return version, Response(status_code=304, headers=headers)
+        except (TypeError, ValueError):
+            pass
+    
+    return version, None
+
+def json_response(content: Dict, response: Response) -> Response:
+    """Render ``content`` straight to JSON, skipping FastAPI's jsonable_encoder pass.
+
+    Headers already set on the injected ``response`` (ETag, Cache-Control)
+    are carried over. ``content`` must be plain JSON types.
+    """
+    return FastJSONResponse(content=content, headers=dict(response.headers))
+
+def ndjson_lines(rows: List[Dict]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(row) + b"\n" for row in rows)
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode('utf-8')
+
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -31,83 +146,248 @@ async def root():
         "endpoints": [
             "/tournaments",
             "/tournaments/filter",
+            "/tournaments/stream",
+            "/tournaments/search",
             "/stats",
-            "/refresh-data"
+            "/cache-stats",
+            "/refresh-data",
+            "/jobs/{job_id}"
         ]
     }
 
 @app.get("/tournaments")
 async def get_tournaments(
+    request: Request,
+    response: Response,
     sport: Optional[str] = Query(None, description="Filter by sport"),
-    level: Optional[str] = Query(None, description="Filter by level")
+    level: Optional[str] = Query(None, description="Filter by level"),
+    limit: int = Query(API_DEFAULT_PAGE_SIZE, ge=1, le=API_MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,tournament_name,start_date"),
+    start_from: Optional[date] = Query(None, description="Earliest start date (YYYY-MM-DD)"),
+    start_to: Optional[date] = Query(None, description="Latest start date (YYYY-MM-DD)"),
+    end_from: Optional[date] = Query(None, description="Earliest end date (YYYY-MM-DD)"),
+    end_to: Optional[date] = Query(None, description="Latest end date (YYYY-MM-DD)")
 ):
     try:
-        if sport or level:
-            tournaments = get_tournaments_by_filter(sport=sport, level=level)
-        else:
-            tournaments = get_all_tournaments()
+        version, not_modified = await conditional_get(request, response)
+        if not_modified:
+            return not_modified
         
-        return {
+        field_list = tuple(field.strip() for field in fields.split(',') if field.strip()) if fields else None
+        page = await run_db(
+            cached_query, get_tournaments_page, version=version,
+            sport=sport, level=level, limit=limit, cursor=cursor, fields=field_list,
+            start_from=start_from, start_to=start_to, end_from=end_from, end_to=end_to
+        )
+        
+        return json_response({
             "success": True,
-            "count": len(tournaments),
-            "tournaments": tournaments
-        }
+            "count": len(page['tournaments']),
+            "tournaments": page['tournaments'],
+            "next_cursor": page['next_cursor']
+        }, response)
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting tournaments: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/tournaments/stream")
+async def stream_tournaments(
+    request: Request,
+    sport: Optional[str] = Query(None, description="Filter by sport"),
+    level: Optional[str] = Query(None, description="Filter by level"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,tournament_name,start_date"),
+    start_from: Optional[date] = Query(None, description="Earliest start date (YYYY-MM-DD)"),
+    start_to: Optional[date] = Query(None, description="Latest start date (YYYY-MM-DD)"),
+    end_from: Optional[date] = Query(None, description="Earliest end date (YYYY-MM-DD)"),
+    end_to: Optional[date] = Query(None, description="Latest end date (YYYY-MM-DD)")
+):
+    field_list = tuple(field.strip() for field in fields.split(',') if field.strip()) if fields else None
+    
+    stream = None
+    try:
+        stream = await run_db(
+            TournamentStream, sport=sport, level=level, fields=field_list,
+            start_from=start_from, start_to=start_to, end_from=end_from, end_to=end_to
+        )
+        # Fetch the first batch before committing to a 200 so read errors still surface as 500s.
+        batch = await run_db(stream.next_batch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error opening tournament stream: {e}")
+        if stream is not None:
+            db_executor.submit(stream.close)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def body():
+        try:
+            current = batch
+            while current:
+                if await request.is_disconnected():
+                    logger.info("Client disconnected from /tournaments/stream")
+                    break
+                yield ndjson_lines(current)
+                current = await run_db(stream.next_batch)
+        finally:
+            # Not awaited: this also runs when the response task is cancelled on disconnect.
+            db_executor.submit(stream.close)
+    
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
 @app.get("/tournaments/filter")
 async def filter_tournaments(
+    request: Request,
+    response: Response,
     sport: Optional[str] = Query(None, description="Filter by sport"),
-    level: Optional[str] = Query(None, description="Filter by level")
+    level: Optional[str] = Query(None, description="Filter by level"),
+    start_from: Optional[date] = Query(None, description="Earliest start date (YYYY-MM-DD)"),
+    start_to: Optional[date] = Query(None, description="Latest start date (YYYY-MM-DD)"),
+    end_from: Optional[date] = Query(None, description="Earliest end date (YYYY-MM-DD)"),
+    end_to: Optional[date] = Query(None, description="Latest end date (YYYY-MM-DD)")
 ):
     try:
-        tournaments = get_tournaments_by_filter(sport=sport, level=level)
+        version, not_modified = await conditional_get(request, response)
+        if not_modified:
+            return not_modified
         
-        return {
+        tournaments = await run_db(
+            cached_query, get_tournaments_by_filter, version=version,
+            sport=sport, level=level,
+            start_from=start_from, start_to=start_to, end_from=end_from, end_to=end_to
+        )
+        
+        return json_response({
             "success": True,
             "filters": {
                 "sport": sport,
-                "level": level
+                "level": level,
+                "start_from": start_from.isoformat() if start_from else None,
+                "start_to": start_to.isoformat() if start_to else None,
+                "end_from": end_from.isoformat() if end_from else None,
+                "end_to": end_to.isoformat() if end_to else None
             },
             "count": len(tournaments),
             "tournaments": tournaments
-        }
+        }, response)
         
     except Exception as e:
         logger.error(f"Error filtering tournaments: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/tournaments/search")
+async def search(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, description="Keywords to match in tournament names and summaries"),
+    sport: Optional[str] = Query(None, description="Filter by sport"),
+    level: Optional[str] = Query(None, description="Filter by level"),
+    start_from: Optional[date] = Query(None, description="Earliest start date (YYYY-MM-DD)"),
+    start_to: Optional[date] = Query(None, description="Latest start date (YYYY-MM-DD)"),
+    limit: int = Query(50, ge=1, le=API_MAX_PAGE_SIZE, description="Maximum number of results")
+):
+    try:
+        version, not_modified = await conditional_get(request, response)
+        if not_modified:
+            return not_modified
+        
+        tournaments = await run_db(
+            cached_query, search_tournaments, version=version,
+            query=q, sport=sport, level=level, start_from=start_from, start_to=start_to, limit=limit
+        )
+        
+        return json_response({
+            "success": True,
+            "query": q,
+            "count": len(tournaments),
+            "tournaments": tournaments
+        }, response)
+        
+    except Exception as e:
+        logger.error(f"Error searching tournaments: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/stats")
-async def get_stats():
+async def get_stats(request: Request, response: Response):
     try:
-        stats = get_tournament_stats()
+        version, not_modified = await conditional_get(request, response)
+        if not_modified:
+            return not_modified
         
-        return {
+        stats = await run_db(cached_query, get_tournament_stats, version=version)
+        
+        return json_response({
             "success": True,
             "stats": stats
-        }
+        }, response)
         
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/refresh-data")
+@app.get("/cache-stats")
+async def cache_stats():
+    return {
+        "success": True,
+        "read_cache": read_cache.stats()
+    }
+
+@app.post("/refresh-data", status_code=202)
 async def refresh_data():
     try:
-        tournaments = collect_tournaments()
+        job = await run_db(job_manager.start_refresh)
         
         return {
             "success": True,
-            "message": f"Data refreshed successfully. Collected {len(tournaments)} tournaments.",
-            "count": len(tournaments)
+            "message": "Data refresh started.",
+            "job_id": job.id,
+            "status_url": f"/jobs/{job.id}"
         }
         
+    except JobAlreadyRunningError as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "job_id": e.job_id})
     except Exception as e:
         logger.error(f"Error refreshing data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/jobs")
+async def list_jobs():
+    return {
+        "success": True,
+        "jobs": [job.to_dict() for job in await run_db(job_manager.list)]
+    }
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = await run_db(job_manager.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    return {
+        "success": True,
+        "job": job.to_dict()
+    }
+
+@app.post("/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    job = await run_db(job_manager.cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    return {
+        "success": True,
+        "job": job.to_dict()
+    }
+
+@app.on_event("shutdown")
+def shutdown_db_pool():
+    # Stop refreshes first: they need the database to flush what they have buffered.
+    job_manager.shutdown()
+    db_executor.shutdown(wait=False)
+
 @app.get("/health")
 async def health_check():
     return {
@@ -3,19 +3,25 @@ Streamlit UI for GenAI Sports Calendar
 Provides interactive dashboard for tournament data with AI insights
 """
 
+import os
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
-from typing import List, Dict, Optional
+from typing import Dict
+
+from dotenv import load_dotenv
+
+# Load .env before the local imports below read their settings, also under `streamlit run`.
+load_dotenv()
 
 # Import local modules
 from db_utils import (
-    get_all_tournaments, get_tournaments_by_filter, 
-    get_tournament_stats, init_database
+    get_all_tournaments, init_database, get_data_version
 )
-from data_collection import collect_tournaments, TournamentCollector
 from export import export_to_csv, export_to_json
+from insights import InsightsService, generate_fallback_insights
+from dashboard_data import FRAME_COLUMNS, tournament_frame, filter_frame, frame_metrics, display_table
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -29,14 +35,46 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# How long the end of a render waits for insights still being generated before showing the fallback.
+INSIGHTS_WAIT_SECONDS = float(os.getenv('INSIGHTS_WAIT_SECONDS', '30'))
+
+@st.cache_resource(show_spinner=False)
+def init_database_once() -> bool:
+    # A failure isn't cached, so the next rerun tries again.
+    init_database()
+    return True
+
+# The whole table is loaded into one typed frame per data version and every filter is
+# applied in memory, so clicking through filters costs no query until the data changes.
+# cache_resource hands back the same frame without copying it; treat it as read-only.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_tournament_frame(data_version: int) -> pd.DataFrame:
+    return tournament_frame(get_all_tournaments(fields=FRAME_COLUMNS))
+
+@st.cache_resource(show_spinner=False)
+def get_insights_service() -> InsightsService:
+    # One service per process, shared by every session.
+    return InsightsService()
+
+def render_insights(insights: Dict):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🎯 Recommendations")
+        st.write(insights['recommendations'])
+    
+    with col2:
+        st.subheader("📈 Trends")
+        st.write(insights['trends'])
+
 def main():
     """Main Streamlit application"""
     st.title("🏆 GenAI Sports Calendar")
     st.markdown("AI-powered sports tournament management using Hugging Face models")
     
-    # Initialize database if needed
+    # Initialize database once per process
     try:
-        init_database()
+        init_database_once()
     except Exception as e:
         st.error(f"Database initialization failed: {e}")
         return
@@ -67,6 +105,8 @@ def main():
         if st.button("🔄 Refresh Data", type="primary"):
             with st.spinner("Collecting new tournament data..."):
                 try:
+                    # Imported here so only a refresh pays for the collection stack
+                    from data_collection import collect_tournaments
                     new_tournaments = collect_tournaments()
                     st.success(f"✅ Data refreshed! Collected {len(new_tournaments)} new tournaments")
                     st.rerun()
@@ -99,84 +139,63 @@ def main():
         sport_filter = None if selected_sport == "All" else selected_sport
         level_filter = None if selected_level == "All" else selected_level
         
-        tournaments = get_tournaments_by_filter(sport=sport_filter, level=level_filter)
-        
-        # Filter by date range
-        filtered_tournaments = []
-        for tournament in tournaments:
-            try:
-                start = datetime.strptime(tournament['start_date'], '%Y-%m-%d').date()
-                if start_date <= start <= end_date:
-                    filtered_tournaments.append(tournament)
-            except:
-                continue
+        # One primary-key read per rerun; the frame is served from cache until it changes.
+        data_version = get_data_version()
+        cache_key = (sport_filter, level_filter, start_date.isoformat(), end_date.isoformat(), data_version)
+        filtered_tournaments = filter_frame(
+            load_tournament_frame(data_version), sport=sport_filter, level=level_filter,
+            start_from=start_date, start_to=end_date
+        )
+        metrics = frame_metrics(filtered_tournaments)
+        has_tournaments = not filtered_tournaments.empty
         
         # Display statistics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Tournaments", len(filtered_tournaments))
+            st.metric("Total Tournaments", metrics['total'])
         
         with col2:
-            upcoming_count = len([t for t in filtered_tournaments 
-                                if datetime.strptime(t['start_date'], '%Y-%m-%d').date() > datetime.now().date()])
-            st.metric("Upcoming", upcoming_count)
+            st.metric("Upcoming", metrics['upcoming'])
         
         with col3:
-            if filtered_tournaments:
-                sports_count = len(set(t['sport'] for t in filtered_tournaments))
-                st.metric("Sports", sports_count)
-            else:
-                st.metric("Sports", 0)
+            st.metric("Sports", metrics['sports'])
         
         with col4:
-            if filtered_tournaments:
-                levels_count = len(set(t['level'] for t in filtered_tournaments))
-                st.metric("Levels", levels_count)
-            else:
-                st.metric("Levels", 0)
+            st.metric("Levels", metrics['levels'])
         
         # AI Insights Section
         st.header("🤖 AI Insights")
         
-        if filtered_tournaments:
-            # Generate AI insights using Hugging Face
-            insights = generate_ai_insights(filtered_tournaments, sport_filter, level_filter)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("🎯 Recommendations")
-                st.write(insights['recommendations'])
-            
-            with col2:
-                st.subheader("📈 Trends")
-                st.write(insights['trends'])
+        insights_future = None
+        insights_placeholder = None
+        if has_tournaments:
+            # Generated in the background; the table below renders without waiting for it
+            insights_future = get_insights_service().submit(
+                cache_key, filtered_tournaments, sport_filter, level_filter
+            )
+            insights_placeholder = st.empty()
+            if insights_future.done():
+                with insights_placeholder.container():
+                    render_insights(insights_future.result())
+            else:
+                insights_placeholder.info("🤖 Generating insights...")
         else:
             st.info("No tournaments found for the selected filters. Try adjusting your criteria or refresh the data.")
         
         # Tournament table
         st.header("🏆 Tournament List")
         
-        if filtered_tournaments:
-            # Convert to DataFrame for better display
-            df_data = []
-            for tournament in filtered_tournaments:
-                df_data.append({
-                    'Tournament Name': tournament['tournament_name'],
-                    'Sport': tournament['sport'],
-                    'Level': tournament['level'],
-                    'Start Date': tournament['start_date'],
-                    'End Date': tournament['end_date'],
-                    'Summary': tournament['summary'][:100] + '...' if len(tournament['summary']) > 100 else tournament['summary']
-                })
-            
-            df = pd.DataFrame(df_data)
-            st.dataframe(df, use_container_width=True)
+        if has_tournaments:
+            st.dataframe(display_table(filtered_tournaments), use_container_width=True)
             
             # Tournament details in expandable sections
             st.subheader("📋 Tournament Details")
-            for i, tournament in enumerate(filtered_tournaments[:10]):  # Show first 10
+            details = filtered_tournaments.head(10).assign(  # Show first 10
+                start_date=lambda df: df['start_date'].dt.strftime('%Y-%m-%d'),
+                end_date=lambda df: df['end_date'].dt.strftime('%Y-%m-%d')
+            )
+            for tournament in details.to_dict('records'):
                 with st.expander(f"🏆 {tournament['tournament_name']}"):
                     col1, col2 = st.columns(2)
                     
@@ -192,7 +211,7 @@ def main():
                         else:
                             st.write("**Official URL:** N/A")
                         
-                        st.write(f"**Streaming:** {tournament.get('streaming_links', 'N/A')}")
+                        st.write(f"**Streaming:** {tournament.get('streaming_links') or 'N/A'}")
                         
                         if tournament.get('tournament_image') and tournament['tournament_image'] != 'N/A':
                             try:
@@ -206,6 +225,16 @@ def main():
         else:
             st.warning("No tournaments found matching the current filters.")
         
+        # Fill in insights that were still pending when the table rendered
+        if insights_future is not None and not insights_future.done():
+            try:
+                insights = insights_future.result(timeout=INSIGHTS_WAIT_SECONDS)
+            except Exception as e:
+                logger.error(f"Insights not ready, showing fallback: {e}")
+                insights = generate_fallback_insights(filtered_tournaments, sport_filter, level_filter)
+            with insights_placeholder.container():
+                render_insights(insights)
+        
         # Footer
         st.markdown("---")
         st.markdown("**GenAI Sports Calendar** - Powered by Hugging Face Transformers")
@@ -214,95 +243,5 @@ def main():
         st.error(f"An error occurred: {e}")
         logger.error(f"Streamlit app error: {e}")
 
-def generate_ai_insights(tournaments: List[Dict], sport: Optional[str], level: Optional[str]) -> Dict:
-    """Generate AI insights using Hugging Face models"""
-    try:
-        # Initialize Hugging Face models
-        collector = TournamentCollector()
-        
-        if not hasattr(collector, 'models') or not collector.models:
-            # Fallback insights without HF models
-            return generate_fallback_insights(tournaments, sport, level)
-        
-        # Generate insights using HF models
-        insights = {}
-        
-        # Generate recommendations
-        if tournaments:
-            sport_names = [t['sport'] for t in tournaments]
-            level_names = [t['level'] for t in tournaments]
-            
-            # Use HF model to generate recommendations
-            prompt = f"Based on {len(tournaments)} tournaments in {sport or 'various sports'} at {level or 'various levels'}, provide 2-3 recommendations for sports fans."
-            
-            try:
-                if 'generator' in collector.models:
-                    response = collector.models['generator'](
-                        prompt,
-                        max_length=150,
-                        num_return_sequences=1,
-                        do_sample=True,
-                        temperature=0.7
-                    )
-                    insights['recommendations'] = response[0]['generated_text'].replace(prompt, '').strip()
-                else:
-                    insights['recommendations'] = generate_fallback_insights(tournaments, sport, level)['recommendations']
-            except:
-                insights['recommendations'] = generate_fallback_insights(tournaments, sport, level)['recommendations']
-            
-            # Generate trends
-            try:
-                if 'generator' in collector.models:
-                    trend_prompt = f"Analyze trends in {sport or 'sports'} tournaments at {level or 'various levels'} based on {len(tournaments)} events."
-                    
-                    response = collector.models['generator'](
-                        trend_prompt,
-                        max_length=120,
-                        num_return_sequences=1,
-                        do_sample=True,
-                        temperature=0.6
-                    )
-                    insights['trends'] = response[0]['generated_text'].replace(trend_prompt, '').strip()
-                else:
-                    insights['trends'] = generate_fallback_insights(tournaments, sport, level)['trends']
-            except:
-                insights['trends'] = generate_fallback_insights(tournaments, sport, level)['trends']
-        
-        return insights
-        
-    except Exception as e:
-        logger.error(f"Error generating AI insights: {e}")
-        return generate_fallback_insights(tournaments, sport, level)
-
-def generate_fallback_insights(tournaments: List[Dict], sport: Optional[str], level: Optional[str]) -> Dict:
-    """Generate fallback insights without HF models"""
-    insights = {}
-    
-    if not tournaments:
-        insights['recommendations'] = "No tournaments available. Try refreshing the data or adjusting filters."
-        insights['trends'] = "Insufficient data for trend analysis."
-        return insights
-    
-    # Simple recommendations based on data
-    sport_count = {}
-    level_count = {}
-    
-    for tournament in tournaments:
-        sport_count[tournament['sport']] = sport_count.get(tournament['sport'], 0) + 1
-        level_count[tournament['level']] = level_count.get(tournament['level'], 0) + 1
-    
-    top_sport = max(sport_count.items(), key=lambda x: x[1])[0] if sport_count else "various sports"
-    top_level = max(level_count.items(), key=lambda x: x[1])[0] if level_count else "various levels"
-    
-    insights['recommendations'] = f"• Focus on {top_sport} tournaments for the most opportunities\n• {top_level} level events are most common\n• Consider exploring multiple sports for variety"
-    
-    # Simple trends
-    upcoming_count = len([t for t in tournaments 
-                         if datetime.strptime(t['start_date'], '%Y-%m-%d').date() > datetime.now().date()])
-    
-    insights['trends'] = f"• {upcoming_count} upcoming tournaments in the next year\n• {len(sport_count)} different sports represented\n• {len(level_count)} different competition levels available"
-    
-    return insights
-
 if __name__ == "__main__":
     main()
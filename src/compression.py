@@ -0,0 +1,193 @@
+import os
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', '4'))
+
+class _GzipCompressor:
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+class _BrotliCompressor:
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+
+    wildcard = accepted.get('*', 0)
+    if brotli is not None and accepted.get('br', wildcard) > 0:
+        return 'br'
+    if accepted.get('gzip', wildcard) > 0:
+        return 'gzip'
+    return None
+
+ETAG_CODINGS = ('gzip', 'br')
+
+def coded_etag(etag: str, encoding: str) -> str:
+    # A strong ETag must differ between content codings of the same representation.
+    if etag.startswith('"') and etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return etag
+
+def strip_etag_coding(etag: str) -> str:
+    for encoding in ETAG_CODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+class CompressionMiddleware:
+    """Compress responses with brotli (when installed) or gzip, per Accept-Encoding.
+
+    Bodies smaller than ``minimum_size`` are sent as-is. Streaming responses
+    are compressed chunk by chunk and flushed after each chunk, so clients
+    still receive data as soon as it is produced.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE,
+                 gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        if encoding == 'br':
+            compressor = _BrotliCompressor(self.brotli_quality)
+        else:
+            compressor = _GzipCompressor(self.gzip_level)
+
+        if_none_match = Headers(scope=scope).get('if-none-match', '')
+        responder = _CompressingResponder(self.app, encoding, compressor, self.minimum_size, if_none_match)
+        await responder(scope, receive, send)
+
+class _CompressingResponder:
+
+    def __init__(self, app, encoding: str, compressor, minimum_size: int, if_none_match: str = ''):
+        self.app = app
+        self.encoding = encoding
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.if_none_match = if_none_match
+        self.send = None
+        self.initial_message = None
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message):
+        message_type = message['type']
+
+        if message_type == 'http.response.start':
+            self.initial_message = message
+            headers = Headers(raw=message['headers'])
+            self.passthrough = (
+                'content-encoding' in headers or
+                message['status'] in (204, 304) or
+                message['status'] < 200
+            )
+            etag = headers.get('etag')
+            if message['status'] == 304 and etag and coded_etag(etag, self.encoding) in self.if_none_match:
+                # Echo the validator the client holds: the coded one if its 200 was compressed.
+                MutableHeaders(raw=message['headers'])['ETag'] = coded_etag(etag, self.encoding)
+            return
+
+        if message_type != 'http.response.body':
+            await self.send(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message['headers'])
+
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                await self.send(self.initial_message)
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            headers['Content-Encoding'] = self.encoding
+            headers.add_vary_header('Accept-Encoding')
+            if 'etag' in headers:
+                headers['ETag'] = coded_etag(headers['etag'], self.encoding)
+
+            if not more_body:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers['Content-Length'] = str(len(body))
+                await self.send(self.initial_message)
+                await self.send({'type': 'http.response.body', 'body': body})
+                return
+
+            if 'content-length' in headers:
+                del headers['Content-Length']
+            await self.send(self.initial_message)
+            await self.send({
+                'type': 'http.response.body',
+                'body': self.compressor.compress(body) + self.compressor.flush(),
+                'more_body': True
+            })
+            return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        chunk = self.compressor.compress(body)
+        chunk += self.compressor.flush() if more_body else self.compressor.finish()
+        await self.send({'type': 'http.response.body', 'body': chunk, 'more_body': more_body})
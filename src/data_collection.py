@@ -1,18 +1,20 @@
 import requests
 import logging
 from datetime import datetime, timedelta
-from dateutil import parser
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import random
 import time
-import openai
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from db_utils import insert_tournament
+from db_utils import TournamentWriter, get_streaming_platforms, save_streaming_platforms
+from llm_cache import LLMCache
+from http_cache import CachingAdapter
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,24 +30,80 @@ LEVELS = [
     "District", "State", "Zonal/Regional", "National", "International"
 ]
 
+COLLECTION_CONCURRENCY = int(os.getenv('COLLECTION_CONCURRENCY', '8'))
+REQUEST_DELAY_SECONDS = float(os.getenv('REQUEST_DELAY_SECONDS', '1'))
+SEARCH_API_URL = os.getenv('SEARCH_API_URL', 'https://api.duckduckgo.com/')
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'True').lower() in ('1', 'true', 'yes')
+LLM_MODEL = "gpt-3.5-turbo"
+EXTRACTION_BATCH_SIZE = int(os.getenv('EXTRACTION_BATCH_SIZE', '6'))
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'True').lower() in ('1', 'true', 'yes')
+STREAMING_CATALOG_MAX_AGE_DAYS = int(os.getenv('STREAMING_CATALOG_MAX_AGE_DAYS', '30'))
+PER_TOURNAMENT_STREAMING = os.getenv('PER_TOURNAMENT_STREAMING', 'False').lower() in ('1', 'true', 'yes')
+
 class TournamentCollector:
     
-    def __init__(self):
+    def __init__(self, llm_cache: Optional[LLMCache] = None, per_tournament_streaming: Optional[bool] = None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        self.search_url = SEARCH_API_URL
+        
+        self.http_cache = None
+        if HTTP_CACHE_ENABLED:
+            try:
+                self.http_cache = CachingAdapter(pool_maxsize=max(COLLECTION_CONCURRENCY, 10))
+                self.session.mount('http://', self.http_cache)
+                self.session.mount('https://', self.http_cache)
+            except Exception as e:
+                logger.error(f"Error opening HTTP cache, continuing without it: {e}")
         
+        # openai and dateutil are imported on first use, so importing this module stays cheap
+        import openai
         openai.api_key = os.getenv('OPENAI_API_KEY')
         if not openai.api_key:
             logger.error("OpenAI API key not found in environment variables")
+        
+        self.llm_cache = llm_cache
+        if self.llm_cache is None and LLM_CACHE_ENABLED:
+            try:
+                self.llm_cache = LLMCache()
+            except Exception as e:
+                logger.error(f"Error opening LLM cache, continuing without it: {e}")
+        
+        self.per_tournament_streaming = PER_TOURNAMENT_STREAMING if per_tournament_streaming is None else per_tournament_streaming
+        self._streaming_catalog = {}
+        self.ingest_stats = {}
+        self._progress = None
+        self._cancel_event = None
+        self._streaming_catalog_lock = threading.Lock()
+    
+    def _chat_completion(self, messages: List[Dict], max_tokens: int, temperature: float) -> str:
+        key = None
+        if self.llm_cache:
+            key = LLMCache.make_key(LLM_MODEL, messages, max_tokens=max_tokens, temperature=temperature)
+            cached = self.llm_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        import openai
+        response = openai.ChatCompletion.create(
+            model=LLM_MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        content = response.choices[0].message.content.strip()
+        
+        if key:
+            self.llm_cache.set(key, content)
+        return content
     
     def generate_search_queries(self, sport: str, level: str, count: int = 5) -> List[str]:
         try:
             prompt = f"Generate {count} specific search queries to find upcoming {sport} tournaments at {level} level happening after {datetime.now().strftime('%Y-%m-%d')}. Focus on official tournament websites, sports organizations, and event calendars. Return only the search queries, one per line."
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
+            content = self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a sports tournament researcher. Generate specific, targeted search queries."},
                     {"role": "user", "content": prompt}
@@ -54,7 +112,7 @@ class TournamentCollector:
                 temperature=0.7
             )
             
-            queries = response.choices[0].message.content.strip().split('\n')
+            queries = content.split('\n')
             return [q.strip() for q in queries if q.strip()][:count]
             
         except Exception as e:
@@ -73,7 +131,6 @@ class TournamentCollector:
     
     def search_web(self, query: str) -> List[Dict]:
         try:
-            search_url = "https://api.duckduckgo.com/"
             params = {
                 'q': query,
                 'format': 'json',
@@ -81,7 +138,7 @@ class TournamentCollector:
                 'skip_disambig': '1'
             }
             
-            response = self.session.get(search_url, params=params, timeout=10)
+            response = self.session.get(self.search_url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -107,7 +164,17 @@ class TournamentCollector:
             logger.error(f"Error searching web: {e}")
             return []
     
-    def extract_tournament_data(self, search_results: List[Dict], sport: str, level: str) -> List[Dict]:
+    def extract_tournament_data(self, search_results: List[Dict], sport: str, level: str,
+                                batch_size: Optional[int] = None) -> List[Dict]:
+        if batch_size is None:
+            batch_size = EXTRACTION_BATCH_SIZE
+        
+        if batch_size > 1:
+            tournaments = []
+            for i in range(0, len(search_results), batch_size):
+                tournaments.extend(self._extract_batch(search_results[i:i + batch_size], sport, level))
+            return tournaments
+        
         tournaments = []
         
         for result in search_results:
@@ -121,6 +188,60 @@ class TournamentCollector:
         
         return tournaments
     
+    def _extract_batch(self, results: List[Dict], sport: str, level: str) -> List[Dict]:
+        if len(results) == 1:
+            return self.extract_tournament_data(results, sport, level, batch_size=1)
+        
+        try:
+            items = "\n".join(
+                f'{i + 1}. "{result.get("title", "")} {result.get("snippet", "")}"'
+                for i, result in enumerate(results)
+            )
+            
+            prompt = f"""
+            Extract tournament information from each of these {len(results)} numbered texts about {sport} at {level} level:
+            {items}
+            
+            Return a JSON array with exactly {len(results)} elements, one per text and in the same order.
+            Each element is either null (no tournament info found) or a JSON object with these fields:
+            - tournament_name: Tournament name
+            - start_date: Start date (YYYY-MM-DD format)
+            - end_date: End date (YYYY-MM-DD format)
+            - tournament_url: Official URL if found
+            - summary: Brief description (max 100 words)
+            """
+            
+            response = self._chat_completion(
+                messages=[
+                    {"role": "system", "content": "You are a data extraction specialist. Extract only tournament information and return valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=min(300 * len(results), 3000),
+                temperature=0.3
+            )
+            
+        except Exception as e:
+            # Network, rate-limit or auth failure: per-result calls would only multiply the load.
+            logger.error(f"Batch extraction call failed, skipping {len(results)} results: {e}")
+            return []
+        
+        try:
+            data = json.loads(response)
+            if not isinstance(data, list) or len(data) != len(results):
+                raise ValueError(f"expected a JSON array of {len(results)} elements")
+            
+        except ValueError as e:
+            # json.JSONDecodeError is a ValueError too; only a malformed answer is retried per result.
+            logger.warning(f"Batch extraction failed, falling back to per-result calls: {e}")
+            return self.extract_tournament_data(results, sport, level, batch_size=1)
+        
+        tournaments = []
+        for result, item in zip(results, data):
+            tournament = self._build_tournament(item, result, sport, level)
+            if tournament:
+                tournaments.append(tournament)
+        return tournaments
+    
     def _extract_from_content(self, result: Dict, sport: str, level: str) -> Optional[Dict]:
         try:
             content = f"{result.get('title', '')} {result.get('snippet', '')}"
@@ -139,8 +260,7 @@ class TournamentCollector:
             If no tournament info found, return null.
             """
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
+            response = self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a data extraction specialist. Extract only tournament information and return valid JSON."},
                     {"role": "user", "content": prompt}
@@ -150,25 +270,7 @@ class TournamentCollector:
             )
             
             try:
-                import json
-                data = json.loads(response.choices[0].message.content.strip())
-                
-                if data and isinstance(data, dict):
-                    tournament = {
-                        'tournament_name': data.get('tournament_name', ''),
-                        'sport': sport,
-                        'level': level,
-                        'start_date': data.get('start_date', ''),
-                        'end_date': data.get('end_date', ''),
-                        'tournament_url': data.get('tournament_url', result.get('url', '')),
-                        'streaming_links': self._suggest_streaming_links(data.get('tournament_name', ''), sport),
-                        'tournament_image': '',
-                        'summary': data.get('summary', '')
-                    }
-                    
-                    if self._validate_tournament_data(tournament):
-                        return tournament
-                        
+                return self._build_tournament(json.loads(response), result, sport, level)
             except json.JSONDecodeError:
                 logger.warning("Failed to parse JSON response from OpenAI")
                 
@@ -177,6 +279,37 @@ class TournamentCollector:
         
         return None
     
+    def _build_tournament(self, data, result: Dict, sport: str, level: str) -> Optional[Dict]:
+        if not data or not isinstance(data, dict):
+            return None
+        
+        tournament = {
+            'tournament_name': data.get('tournament_name', ''),
+            'sport': sport,
+            'level': level,
+            'start_date': data.get('start_date', ''),
+            'end_date': data.get('end_date', ''),
+            'tournament_url': data.get('tournament_url', result.get('url', '')),
+            'streaming_links': '',
+            'tournament_image': '',
+            'summary': data.get('summary', '')
+        }
+        
+        if not self._validate_tournament_data(tournament):
+            return None
+        
+        from dateutil import parser
+        
+        # Stored as ISO dates so the database can range-filter them as text
+        tournament['start_date'] = parser.parse(tournament['start_date']).strftime('%Y-%m-%d')
+        tournament['end_date'] = parser.parse(tournament['end_date']).strftime('%Y-%m-%d')
+        
+        if self.per_tournament_streaming:
+            tournament['streaming_links'] = self._suggest_streaming_links(tournament['tournament_name'], sport)
+        else:
+            tournament['streaming_links'] = self.get_catalog_streaming_links(sport, level)
+        return tournament
+    
     def _validate_tournament_data(self, tournament: Dict) -> bool:
         required_fields = ['tournament_name', 'start_date', 'end_date']
         
@@ -184,6 +317,8 @@ class TournamentCollector:
             if not tournament.get(field):
                 return False
         
+        from dateutil import parser
+        
         try:
             start_date = parser.parse(tournament['start_date'])
             end_date = parser.parse(tournament['end_date'])
@@ -200,8 +335,7 @@ class TournamentCollector:
         try:
             prompt = f"Suggest 2-3 streaming platforms or TV channels that might broadcast {sport} tournaments like '{tournament_name}'. Return only the platform names separated by commas."
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
+            return self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a sports broadcasting expert. Suggest relevant streaming platforms."},
                     {"role": "user", "content": prompt}
@@ -210,48 +344,221 @@ class TournamentCollector:
                 temperature=0.5
             )
             
-            return response.choices[0].message.content.strip()
-            
         except Exception as e:
             logger.error(f"Error suggesting streaming links: {e}")
             return "N/A"
     
-    def collect_tournaments(self, max_per_sport: int = 3) -> List[Dict]:
+    def get_catalog_streaming_links(self, sport: str, level: str) -> str:
+        key = (sport, level)
+        with self._streaming_catalog_lock:
+            if key in self._streaming_catalog:
+                return self._streaming_catalog[key]
+        
+        platforms = get_streaming_platforms(sport, level, max_age_days=STREAMING_CATALOG_MAX_AGE_DAYS)
+        if platforms is None:
+            platforms = self._suggest_catalog_platforms(sport, level)
+            if platforms != "N/A":
+                save_streaming_platforms(sport, level, platforms)
+        
+        with self._streaming_catalog_lock:
+            self._streaming_catalog[key] = platforms
+        return platforms
+    
+    def _suggest_catalog_platforms(self, sport: str, level: str) -> str:
+        try:
+            prompt = f"Suggest 2-3 streaming platforms or TV channels that typically broadcast {sport} tournaments at {level} level. Return only the platform names separated by commas."
+            
+            return self._chat_completion(
+                messages=[
+                    {"role": "system", "content": "You are a sports broadcasting expert. Suggest relevant streaming platforms."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=100,
+                temperature=0.5
+            )
+            
+        except Exception as e:
+            logger.error(f"Error suggesting streaming platforms for {sport} at {level} level: {e}")
+            return "N/A"
+    
+    def refresh_streaming_catalog(self, force: bool = False, concurrency: Optional[int] = None) -> int:
+        if concurrency is None:
+            concurrency = COLLECTION_CONCURRENCY
+        
+        def refresh(combination):
+            sport, level = combination
+            if not force and get_streaming_platforms(sport, level, max_age_days=STREAMING_CATALOG_MAX_AGE_DAYS) is not None:
+                return False
+            
+            platforms = self._suggest_catalog_platforms(sport, level)
+            if platforms == "N/A" or not save_streaming_platforms(sport, level, platforms):
+                return False
+            
+            with self._streaming_catalog_lock:
+                self._streaming_catalog[combination] = platforms
+            return True
+        
+        combinations = [(sport, level) for sport in SPORTS for level in LEVELS]
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="catalog") as pool:
+            refreshed = sum(pool.map(refresh, combinations))
+        
+        logger.info(f"Refreshed {refreshed} streaming catalog entries")
+        return refreshed
+    
+    def collect_tournaments(self, max_per_sport: int = 3, concurrency: Optional[int] = None,
+                            progress: Optional[Callable] = None,
+                            cancel_event: Optional[threading.Event] = None) -> List[Dict]:
+        if concurrency is None:
+            concurrency = COLLECTION_CONCURRENCY
+        
+        self._progress = progress
+        self._cancel_event = cancel_event
+        started = time.perf_counter()
+        with TournamentWriter() as writer:
+            if concurrency > 1:
+                all_tournaments = self._collect_concurrently(max_per_sport, concurrency, writer)
+            else:
+                all_tournaments = self._collect_sequentially(max_per_sport, writer)
+        elapsed = time.perf_counter() - started
+        self.ingest_stats = dict(writer.stats)
+        if writer.failed:
+            # Only rows that reached the database count as collected.
+            failed = {id(tournament) for tournament in writer.failed}
+            all_tournaments = [tournament for tournament in all_tournaments if id(tournament) not in failed]
+            logger.error(f"{len(writer.failed)} collected tournaments could not be saved")
+        
+        if self._is_cancelled():
+            logger.info("Collection cancelled")
+        logger.info(f"Total tournaments collected: {len(all_tournaments)} in {elapsed:.1f}s (concurrency={max(concurrency, 1)})")
+        logger.info(f"Ingest: {self.ingest_stats}")
+        if self.llm_cache:
+            logger.info(f"LLM cache: {self.llm_cache.stats()}")
+        if self.http_cache:
+            logger.info(f"HTTP cache: {self.http_cache.stats()}")
+        return all_tournaments
+    
+    def _is_cancelled(self) -> bool:
+        return self._cancel_event is not None and self._cancel_event.is_set()
+    
+    def _report(self, sport: str, level: str, status: str, count: int = 0, error: Optional[str] = None):
+        if self._progress is None:
+            return
+        try:
+            self._progress(sport, level, status, count, error)
+        except Exception as e:
+            logger.error(f"Error reporting collection progress: {e}")
+    
+    def _collect_sequentially(self, max_per_sport: int, writer: TournamentWriter) -> List[Dict]:
         all_tournaments = []
         
         for sport in SPORTS:
             for level in LEVELS:
+                if self._is_cancelled():
+                    return all_tournaments
+                
                 try:
                     logger.info(f"Collecting {sport} tournaments at {level} level...")
+                    self._report(sport, level, 'running')
                     
                     queries = self.generate_search_queries(sport, level, 3)
-                    sport_tournaments = []
-                    
+                    query_results = []
                     for query in queries:
-                        search_results = self.search_web(query)
-                        tournaments = self.extract_tournament_data(search_results, sport, level)
-                        
-                        for tournament in tournaments:
-                            if len(sport_tournaments) >= max_per_sport:
-                                break
-                            
-                            if self._is_unique_tournament(tournament, sport_tournaments):
-                                sport_tournaments.append(tournament)
-                                if insert_tournament(tournament):
-                                    all_tournaments.append(tournament)
-                                    logger.info(f"Added tournament: {tournament['tournament_name']}")
-                        
-                        time.sleep(1)
+                        if self._is_cancelled():
+                            return all_tournaments
+                        query_results.append(self._run_query(query, sport, level))
                     
-                    logger.info(f"Collected {len(sport_tournaments)} {sport} tournaments at {level} level")
+                    added = self._merge_combination(query_results, sport, level, max_per_sport, writer)
+                    all_tournaments.extend(added)
+                    self._report(sport, level, 'done', len(added))
                     
                 except Exception as e:
                     logger.error(f"Error collecting {sport} tournaments at {level} level: {e}")
+                    self._report(sport, level, 'error', error=str(e))
                     continue
         
-        logger.info(f"Total tournaments collected: {len(all_tournaments)}")
         return all_tournaments
     
+    def _collect_concurrently(self, max_per_sport: int, concurrency: int, writer: TournamentWriter) -> List[Dict]:
+        combinations = [(sport, level) for sport in SPORTS for level in LEVELS]
+        query_results = {}
+        remaining = {}
+        collected = {}
+        
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="collector") as pool:
+            pending = {}
+            for combination in combinations:
+                sport, level = combination
+                logger.info(f"Collecting {sport} tournaments at {level} level...")
+                pending[pool.submit(self.generate_search_queries, sport, level, 3)] = (combination, None)
+            
+            while pending:
+                if self._is_cancelled():
+                    for future in pending:
+                        future.cancel()
+                    break
+                
+                done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    combination, index = pending.pop(future)
+                    sport, level = combination
+                    
+                    if combination in collected:
+                        continue
+                    
+                    try:
+                        if index is None:
+                            queries = future.result()
+                            self._report(sport, level, 'running')
+                            query_results[combination] = [[] for _ in queries]
+                            remaining[combination] = len(queries)
+                            for i, query in enumerate(queries):
+                                pending[pool.submit(self._run_query, query, sport, level)] = (combination, i)
+                        else:
+                            query_results[combination][index] = future.result()
+                            remaining[combination] -= 1
+                        
+                        if remaining[combination] == 0:
+                            collected[combination] = self._merge_combination(
+                                query_results[combination], sport, level, max_per_sport, writer
+                            )
+                            self._report(sport, level, 'done', len(collected[combination]))
+                    
+                    except Exception as e:
+                        logger.error(f"Error collecting {sport} tournaments at {level} level: {e}")
+                        self._report(sport, level, 'error', error=str(e))
+                        collected[combination] = []
+        
+        all_tournaments = []
+        for combination in combinations:
+            all_tournaments.extend(collected.get(combination, []))
+        return all_tournaments
+    
+    def _run_query(self, query: str, sport: str, level: str) -> List[Dict]:
+        search_results = self.search_web(query)
+        tournaments = self.extract_tournament_data(search_results, sport, level)
+        time.sleep(REQUEST_DELAY_SECONDS)
+        return tournaments
+    
+    def _merge_combination(self, query_results: List[List[Dict]], sport: str, level: str, max_per_sport: int,
+                           writer: TournamentWriter) -> List[Dict]:
+        sport_tournaments = []
+        added = []
+        
+        for tournaments in query_results:
+            for tournament in tournaments:
+                if len(sport_tournaments) >= max_per_sport:
+                    break
+                
+                if self._is_unique_tournament(tournament, sport_tournaments):
+                    sport_tournaments.append(tournament)
+                    writer.add(tournament)
+                    added.append(tournament)
+                    logger.info(f"Added tournament: {tournament['tournament_name']}")
+        
+        logger.info(f"Collected {len(sport_tournaments)} {sport} tournaments at {level} level")
+        return added
+    
     def _is_unique_tournament(self, tournament: Dict, existing_tournaments: List[Dict]) -> bool:
         for existing in existing_tournaments:
             if (existing['tournament_name'].lower() == tournament['tournament_name'].lower() or
@@ -259,9 +566,13 @@ class TournamentCollector:
                 return False
         return True
 
-def collect_tournaments() -> List[Dict]:
+def collect_tournaments(concurrency: Optional[int] = None) -> List[Dict]:
+    collector = TournamentCollector()
+    return collector.collect_tournaments(concurrency=concurrency)
+
+def refresh_streaming_catalog(force: bool = False) -> int:
     collector = TournamentCollector()
-    return collector.collect_tournaments()
+    return collector.refresh_streaming_catalog(force=force)
 
 if __name__ == "__main__":
     tournaments = collect_tournaments()
@@ -1,8 +1,14 @@
 import sqlite3
+import base64
+import json
 import logging
+import os
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -10,15 +16,88 @@ logger = logging.getLogger(__name__)
 DB_PATH = Path("data/initial.db")
 DB_PATH.parent.mkdir(exist_ok=True)
 
-def get_connection():
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+SQLITE_CACHE_SIZE_KB = int(os.getenv('SQLITE_CACHE_SIZE_KB', '20000'))
+SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+WRITER_MAX_ROWS = int(os.getenv('WRITER_MAX_ROWS', '500'))
+WRITER_MAX_INTERVAL_SECONDS = float(os.getenv('WRITER_MAX_INTERVAL_SECONDS', '5'))
+STREAM_BATCH_SIZE = int(os.getenv('STREAM_BATCH_SIZE', '500'))
+
+TOURNAMENT_COLUMNS = (
+    'tournament_name', 'sport', 'level', 'start_date', 'end_date',
+    'tournament_url', 'streaming_links', 'tournament_image', 'summary'
+)
+
+TOURNAMENT_FIELDS = ('id',) + TOURNAMENT_COLUMNS + ('last_updated',)
+
+NATURAL_KEY = "lower(trim(tournament_name)), sport, start_date"
+
+UPSERT_TOURNAMENT_SQL = f"""
+    INSERT INTO tournaments ({', '.join(TOURNAMENT_COLUMNS)})
+    VALUES ({', '.join('?' for _ in TOURNAMENT_COLUMNS)})
+    ON CONFLICT({NATURAL_KEY}) DO UPDATE SET
+        {', '.join(f'{column} = excluded.{column}' for column in TOURNAMENT_COLUMNS)},
+        last_updated = CURRENT_TIMESTAMP
+    WHERE {' OR '.join(f'tournaments.{column} IS NOT excluded.{column}' for column in TOURNAMENT_COLUMNS)}
+"""
+
+_local = threading.local()
+
+def open_connection(check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+        cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+        check_same_thread=check_same_thread
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    return conn
+
+def get_connection() -> sqlite3.Connection:
+    """Return this thread's connection, opening it on first use.
+
+    Connections stay open for the life of the thread so the pragmas above and
+    sqlite3's prepared-statement cache are paid for once, not per query.
+    """
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.row_factory = sqlite3.Row
+        conn = getattr(_local, 'conn', None)
+        if conn is None or _local.path != DB_PATH:
+            close_connection()
+            conn = open_connection()
+            _local.conn = conn
+            _local.path = DB_PATH
         return conn
     except Exception as e:
         logger.error(f"Error connecting to database: {e}")
         raise
 
+def close_connection():
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        _local.conn = None
+        conn.close()
+
+def get_sqlite_settings() -> Dict:
+    # What the server launcher checks before starting several worker processes on one file.
+    conn = get_connection()
+    return {
+        'journal_mode': conn.execute("PRAGMA journal_mode").fetchone()[0].lower(),
+        'busy_timeout_ms': conn.execute("PRAGMA busy_timeout").fetchone()[0]
+    }
+
+def rollback():
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
 def init_database():
     try:
         conn = get_connection()
@@ -43,134 +122,637 @@ def init_database():
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_sport ON tournaments(sport)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_level ON tournaments(level)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_start_date ON tournaments(start_date)")
+        cursor.execute("DROP INDEX IF EXISTS idx_sport_level")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sport_level_start ON tournaments(sport, level, start_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_last_updated ON tournaments(last_updated)")
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS db_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("INSERT OR IGNORE INTO db_meta (key, value) VALUES ('data_version', 0)")
+        cursor.execute("""
+            INSERT OR IGNORE INTO db_meta (key, value)
+            SELECT 'modified_at', CAST(strftime('%s', COALESCE(MAX(last_updated), 'now')) AS INTEGER) FROM tournaments
+        """)
+        
+        # Only real changes bump the data version; a plain restart keeps read caches and ETags valid.
+        changed = False
+        cursor.execute("SELECT 1 FROM db_meta WHERE key = 'iso_dates'")
+        if cursor.fetchone() is None:
+            changed |= _normalize_dates(cursor)
+            cursor.execute("INSERT INTO db_meta (key, value) VALUES ('iso_dates', 1)")
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_natural_key'")
+        if cursor.fetchone() is None:
+            cursor.execute(f"""
+                DELETE FROM tournaments WHERE id NOT IN (
+                    SELECT MAX(id) FROM tournaments GROUP BY {NATURAL_KEY}
+                )
+            """)
+            if cursor.rowcount:
+                changed = True
+                logger.info(f"Removed {cursor.rowcount} duplicate tournaments")
+            cursor.execute(f"CREATE UNIQUE INDEX idx_natural_key ON tournaments({NATURAL_KEY})")
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS streaming_catalog (
+                sport TEXT NOT NULL,
+                level TEXT NOT NULL,
+                platforms TEXT NOT NULL,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (sport, level)
+            )
+        """)
+        
+        # Refresh jobs are shared by every API worker process; at most one may be active.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS refresh_jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                collected INTEGER NOT NULL DEFAULT 0,
+                ingest TEXT NOT NULL DEFAULT '{}',
+                errors TEXT NOT NULL DEFAULT '[]',
+                progress TEXT NOT NULL DEFAULT '[]',
+                heartbeat_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_refresh_jobs_active
+            ON refresh_jobs(status IN ('queued', 'running')) WHERE status IN ('queued', 'running')
+        """)
+        
+        changed |= _init_search_index(cursor)
+        changed |= _init_stats_table(cursor)
+        
+        if changed:
+            _bump_data_version(cursor)
         
         conn.commit()
         logger.info("Database initialized successfully")
         
     except Exception as e:
+        rollback()
         logger.error(f"Error initializing database: {e}")
         raise
-    finally:
-        conn.close()
 
-def insert_tournament(tournament_data: Dict) -> bool:
+def _normalize_dates(cursor: sqlite3.Cursor) -> bool:
+    """Rewrite stored dates to ISO 'YYYY-MM-DD', once per database.
+
+    Range filters and the monthly stats compare dates as text, but rows saved
+    before the collector normalized dates hold whatever format the LLM
+    returned. Rows whose dates can't be parsed are kept as they are and their
+    ids logged; they simply drop out of date range filters. Rows that turn out
+    to duplicate an existing tournament once normalized are merged into it.
+    """
+    iso = "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+    rows = cursor.execute(f"""
+        SELECT id, start_date, end_date FROM tournaments
+        WHERE start_date NOT GLOB '{iso}' OR end_date NOT GLOB '{iso}'
+    """).fetchall()
+    if not rows:
+        return False
+    
+    # Only a database with legacy dates pays for importing dateutil.
+    from dateutil import parser
+    
+    fixed = merged = 0
+    unparseable = []
+    for tournament_id, start_date, end_date in rows:
+        try:
+            start_date = parser.parse(str(start_date)).strftime('%Y-%m-%d')
+            end_date = parser.parse(str(end_date)).strftime('%Y-%m-%d')
+        except (ValueError, OverflowError):
+            unparseable.append(tournament_id)
+            continue
+        
+        try:
+            cursor.execute(
+                "UPDATE tournaments SET start_date = ?, end_date = ? WHERE id = ?",
+                (start_date, end_date, tournament_id)
+            )
+            fixed += 1
+        except sqlite3.IntegrityError:
+            # Same tournament already stored with ISO dates by the unique natural key.
+            cursor.execute("DELETE FROM tournaments WHERE id = ?", (tournament_id,))
+            merged += 1
+    
+    logger.info(f"Normalized dates: {fixed} tournaments rewritten, {merged} duplicates merged")
+    if unparseable:
+        logger.warning(f"Kept {len(unparseable)} tournaments with unparseable dates as stored: ids {unparseable}")
+    return bool(fixed or merged)
+
+def _init_search_index(cursor: sqlite3.Cursor) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'tournaments_fts'")
+    exists = cursor.fetchone() is not None
+    
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS tournaments_fts USING fts5(
+                tournament_name, summary,
+                content='tournaments', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable (SQLite built without FTS5?): {e}")
+        return False
+    
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tournaments_fts_insert AFTER INSERT ON tournaments BEGIN
+            INSERT INTO tournaments_fts(rowid, tournament_name, summary)
+            VALUES (new.id, new.tournament_name, new.summary);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tournaments_fts_delete AFTER DELETE ON tournaments BEGIN
+            INSERT INTO tournaments_fts(tournaments_fts, rowid, tournament_name, summary)
+            VALUES ('delete', old.id, old.tournament_name, old.summary);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tournaments_fts_update AFTER UPDATE OF tournament_name, summary ON tournaments BEGIN
+            INSERT INTO tournaments_fts(tournaments_fts, rowid, tournament_name, summary)
+            VALUES ('delete', old.id, old.tournament_name, old.summary);
+            INSERT INTO tournaments_fts(rowid, tournament_name, summary)
+            VALUES (new.id, new.tournament_name, new.summary);
+        END
+    """)
+    
+    if not exists:
+        cursor.execute("INSERT INTO tournaments_fts(tournaments_fts) VALUES ('rebuild')")
+    return not exists
+
+def _init_stats_table(cursor: sqlite3.Cursor) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'tournament_counts'")
+    exists = cursor.fetchone() is not None
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tournament_counts (
+            sport TEXT NOT NULL,
+            level TEXT NOT NULL,
+            month TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (sport, level, month)
+        )
+    """)
+    
+    increment = """
+        INSERT INTO tournament_counts (sport, level, month, count)
+        VALUES (new.sport, new.level, substr(new.start_date, 1, 7), 1)
+        ON CONFLICT(sport, level, month) DO UPDATE SET count = count + 1;
+    """
+    decrement = """
+        UPDATE tournament_counts SET count = count - 1
+        WHERE sport = old.sport AND level = old.level AND month = substr(old.start_date, 1, 7);
+        DELETE FROM tournament_counts
+        WHERE sport = old.sport AND level = old.level AND month = substr(old.start_date, 1, 7) AND count <= 0;
+    """
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS tournament_counts_insert AFTER INSERT ON tournaments BEGIN {increment} END")
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS tournament_counts_delete AFTER DELETE ON tournaments BEGIN {decrement} END")
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tournament_counts_update AFTER UPDATE OF sport, level, start_date ON tournaments
+        BEGIN {decrement} {increment} END
+    """)
+    
+    if not exists:
+        _rebuild_stats(cursor)
+    return not exists
+
+def _rebuild_stats(cursor: sqlite3.Cursor):
+    cursor.execute("DELETE FROM tournament_counts")
+    cursor.execute("""
+        INSERT INTO tournament_counts (sport, level, month, count)
+        SELECT sport, level, substr(start_date, 1, 7), COUNT(*)
+        FROM tournaments
+        GROUP BY sport, level, substr(start_date, 1, 7)
+    """)
+
+def rebuild_tournament_stats() -> bool:
     try:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            INSERT INTO tournaments (
-                tournament_name, sport, level, start_date, end_date,
-                tournament_url, streaming_links, tournament_image, summary
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            tournament_data.get('tournament_name'),
-            tournament_data.get('sport'),
-            tournament_data.get('level'),
-            tournament_data.get('start_date'),
-            tournament_data.get('end_date'),
-            tournament_data.get('tournament_url'),
-            tournament_data.get('streaming_links'),
-            tournament_data.get('tournament_image'),
-            tournament_data.get('summary')
-        ))
+        _rebuild_stats(cursor)
+        _bump_data_version(cursor)
         
         conn.commit()
-        logger.info(f"Inserted tournament: {tournament_data.get('tournament_name')}")
+        logger.info("Tournament stats rebuilt")
         return True
         
     except Exception as e:
-        logger.error(f"Error inserting tournament: {e}")
+        rollback()
+        logger.error(f"Error rebuilding tournament stats: {e}")
         return False
-    finally:
-        conn.close()
 
-def get_all_tournaments() -> List[Dict]:
+def _bump_data_version(cursor: sqlite3.Cursor):
+    # Called inside every write transaction so readers can tell cached results are stale.
+    # modified_at moves with it, so deletes advance Last-Modified too (MAX(last_updated) can't).
+    cursor.execute("UPDATE db_meta SET value = value + 1 WHERE key = 'data_version'")
+    cursor.execute("UPDATE db_meta SET value = CAST(strftime('%s', 'now') AS INTEGER) WHERE key = 'modified_at'")
+
+def get_data_version() -> int:
     try:
         conn = get_connection()
-        cursor = conn.cursor()
+        row = conn.execute("SELECT value FROM db_meta WHERE key = 'data_version'").fetchone()
+        return row['value'] if row else 0
         
-        cursor.execute("SELECT * FROM tournaments ORDER BY start_date ASC")
-        rows = cursor.fetchall()
+    except Exception as e:
+        logger.error(f"Error fetching data version: {e}")
+        raise
+
+def get_last_modified() -> Optional[str]:
+    try:
+        conn = get_connection()
+        row = conn.execute(
+            "SELECT datetime(value, 'unixepoch') AS last_modified FROM db_meta WHERE key = 'modified_at'"
+        ).fetchone()
+        return row['last_modified'] if row else None
+        
+    except Exception as e:
+        logger.error(f"Error fetching last modified time: {e}")
+        raise
+
+def _tournament_params(tournament_data: Dict) -> Tuple:
+    return tuple(tournament_data.get(column) for column in TOURNAMENT_COLUMNS)
+
+def insert_tournament(tournament_data: Dict) -> bool:
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
         
-        tournaments = []
-        for row in rows:
-            tournament = dict(row)
-            tournament['start_date'] = str(tournament['start_date'])
-            tournament['end_date'] = str(tournament['end_date'])
-            tournament['last_updated'] = str(tournament['last_updated'])
-            tournaments.append(tournament)
+        cursor.execute(UPSERT_TOURNAMENT_SQL, _tournament_params(tournament_data))
+        if cursor.rowcount:
+            _bump_data_version(cursor)
         
-        return tournaments
+        conn.commit()
+        logger.info(f"Upserted tournament: {tournament_data.get('tournament_name')}")
+        return True
         
     except Exception as e:
-        logger.error(f"Error fetching tournaments: {e}")
-        return []
-    finally:
-        conn.close()
+        rollback()
+        logger.error(f"Error inserting tournament: {e}")
+        return False
+
+def insert_tournaments_bulk(tournaments: Iterable[Dict], failed: Optional[List[Dict]] = None) -> Dict[str, int]:
+    """Upsert tournaments in one transaction and return per-outcome counts.
 
-def get_tournaments_by_filter(sport: Optional[str] = None, level: Optional[str] = None) -> List[Dict]:
+    If the batch hits a constraint violation it is replayed row by row in the
+    same transaction, so only the offending rows fail. Those (or the whole
+    batch, for any other error) are appended to ``failed`` when given.
+    """
+    stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+    tournaments = list(tournaments)
+    rejected = []
     try:
         conn = get_connection()
-        cursor = conn.cursor()
+        rows = [_tournament_params(tournament) for tournament in tournaments]
         
-        query = "SELECT * FROM tournaments WHERE 1=1"
-        params = []
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            max_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM tournaments").fetchone()[0]
+            cursor.execute("SAVEPOINT bulk_upsert")
+            try:
+                changed = cursor.executemany(UPSERT_TOURNAMENT_SQL, rows).rowcount
+                cursor.execute("RELEASE bulk_upsert")
+            except sqlite3.IntegrityError as e:
+                # Undo the rows executemany got through, then keep every row that is valid.
+                cursor.execute("ROLLBACK TO bulk_upsert")
+                cursor.execute("RELEASE bulk_upsert")
+                logger.warning(f"Bulk upsert hit a constraint violation ({e}), retrying row by row")
+                changed = 0
+                for tournament, row in zip(tournaments, rows):
+                    try:
+                        changed += cursor.execute(UPSERT_TOURNAMENT_SQL, row).rowcount
+                    except sqlite3.IntegrityError as row_error:
+                        logger.error(f"Skipping tournament {tournament.get('tournament_name')!r}: {row_error}")
+                        rejected.append(tournament)
+            inserted = cursor.execute("SELECT COUNT(*) FROM tournaments WHERE id > ?", (max_id,)).fetchone()[0]
+            if changed:
+                _bump_data_version(cursor)
         
-        if sport:
-            query += " AND sport = ?"
-            params.append(sport)
+        stats['inserted'] = inserted
+        stats['updated'] = changed - inserted
+        stats['failed'] = len(rejected)
+        stats['unchanged'] = len(tournaments) - changed - len(rejected)
+        if failed is not None:
+            failed.extend(rejected)
+        logger.info(f"Bulk upserted {len(tournaments)} tournaments: {stats}")
+        return stats
         
-        if level:
-            query += " AND level = ?"
-            params.append(level)
+    except Exception as e:
+        rollback()
+        # The whole batch rolled back.
+        stats['failed'] = len(tournaments)
+        if failed is not None:
+            failed.extend(tournaments)
+        logger.error(f"Error bulk inserting {stats['failed']} tournaments: {e}")
+        return stats
+
+class TournamentWriter:
+    """Buffers tournaments and writes them with insert_tournaments_bulk.
+
+    The buffer is flushed once it holds ``max_rows`` rows, by a background
+    timer once rows have waited ``max_interval`` seconds, and on close. Rows
+    that failed to write are kept in ``failed``.
+    """
+    
+    def __init__(self, max_rows: int = WRITER_MAX_ROWS, max_interval: float = WRITER_MAX_INTERVAL_SECONDS):
+        self.max_rows = max_rows
+        self.max_interval = max_interval
+        self.stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+        self.failed = []
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = threading.Event()
+        self._flusher = None
+        if max_interval and max_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="writer-flush", daemon=True)
+            self._flusher.start()
+    
+    def _flush_periodically(self):
+        # Rows must not sit unwritten while the collector spends a while finding nothing new.
+        while not self._closed.wait(self.max_interval / 2):
+            with self._lock:
+                if self._buffer and time.monotonic() - self._last_flush >= self.max_interval:
+                    self._flush_locked()
+    
+    def add(self, tournament_data: Dict):
+        with self._lock:
+            self._buffer.append(tournament_data)
+            if (len(self._buffer) >= self.max_rows or
+                    time.monotonic() - self._last_flush >= self.max_interval):
+                self._flush_locked()
+    
+    def flush(self) -> Dict[str, int]:
+        with self._lock:
+            return self._flush_locked()
+    
+    def _flush_locked(self) -> Dict[str, int]:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return {}
         
-        query += " ORDER BY start_date ASC"
+        rows, self._buffer = self._buffer, []
+        stats = insert_tournaments_bulk(rows, failed=self.failed)
+        for key, count in stats.items():
+            self.stats[key] += count
+        return stats
+    
+    def close(self):
+        self._closed.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def _select_fields(fields: Optional[List[str]], *required: str) -> str:
+    if not fields:
+        return "*"
+    
+    unknown = [field for field in fields if field not in TOURNAMENT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    
+    columns = list(dict.fromkeys(list(fields) + list(required)))
+    return ", ".join(columns)
+
+def _row_to_dict(row: sqlite3.Row, fields: Optional[List[str]] = None) -> Dict:
+    # Dates are stored as ISO text already, so rows go out without per-field conversion.
+    if fields:
+        return {field: row[field] for field in fields}
+    return dict(row)
+
+def _filter_clause(sport: Optional[str] = None, level: Optional[str] = None,
+                   start_from: Optional[str] = None, start_to: Optional[str] = None,
+                   end_from: Optional[str] = None, end_to: Optional[str] = None) -> Tuple[str, List]:
+    query = " WHERE 1=1"
+    params = []
+    
+    if sport:
+        query += " AND sport = ?"
+        params.append(sport)
+    
+    if level:
+        query += " AND level = ?"
+        params.append(level)
+    
+    # Dates are stored as ISO 'YYYY-MM-DD' text, so string comparison is date order.
+    for column, operator, value in (
+        ('start_date', '>=', start_from), ('start_date', '<=', start_to),
+        ('end_date', '>=', end_from), ('end_date', '<=', end_to)
+    ):
+        if value:
+            query += f" AND {column} {operator} ?"
+            params.append(str(value))
+    
+    return query, params
+
+def encode_cursor(start_date: str, tournament_id: int) -> str:
+    payload = json.dumps([start_date, tournament_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        start_date, tournament_id = json.loads(payload)
+        return str(start_date), int(tournament_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def get_all_tournaments(fields: Optional[List[str]] = None) -> List[Dict]:
+    return get_tournaments_by_filter(fields=fields)
+
+def get_tournaments_by_filter(sport: Optional[str] = None, level: Optional[str] = None,
+                              fields: Optional[List[str]] = None,
+                              start_from: Optional[str] = None, start_to: Optional[str] = None,
+                              end_from: Optional[str] = None, end_to: Optional[str] = None) -> List[Dict]:
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        where, params = _filter_clause(sport, level, start_from, start_to, end_from, end_to)
+        query = f"SELECT {_select_fields(fields)} FROM tournaments{where} ORDER BY start_date ASC, id ASC"
         
         cursor.execute(query, params)
-        rows = cursor.fetchall()
+        return [_row_to_dict(row) for row in cursor.fetchall()]
         
-        tournaments = []
-        for row in rows:
-            tournament = dict(row)
-            tournament['start_date'] = str(tournament['start_date'])
-            tournament['end_date'] = str(tournament['end_date'])
-            tournament['last_updated'] = str(tournament['last_updated'])
-            tournaments.append(tournament)
+    except Exception as e:
+        logger.error(f"Error fetching filtered tournaments: {e}")
+        raise
+
+def get_tournaments_page(sport: Optional[str] = None, level: Optional[str] = None, limit: int = 100,
+                         cursor: Optional[str] = None, fields: Optional[List[str]] = None,
+                         start_from: Optional[str] = None, start_to: Optional[str] = None,
+                         end_from: Optional[str] = None, end_to: Optional[str] = None) -> Dict:
+    """Return one page of tournaments ordered by (start_date, id).
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to get the following
+    page; it is None on the last page. Raises ValueError for an invalid cursor
+    or unknown field names.
+    """
+    columns = _select_fields(fields, 'id', 'start_date')
+    where, params = _filter_clause(sport, level, start_from, start_to, end_from, end_to)
+    
+    if cursor:
+        where += " AND (start_date, id) > (?, ?)"
+        params.extend(decode_cursor(cursor))
+    
+    try:
+        conn = get_connection()
+        rows = conn.execute(
+            f"SELECT {columns} FROM tournaments{where} ORDER BY start_date ASC, id ASC LIMIT ?",
+            params + [limit + 1]
+        ).fetchall()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['start_date'], rows[-1]['id'])
         
-        return tournaments
+        return {
+            'tournaments': [_row_to_dict(row, fields) for row in rows],
+            'next_cursor': next_cursor
+        }
         
     except Exception as e:
-        logger.error(f"Error fetching filtered tournaments: {e}")
+        logger.error(f"Error fetching tournament page: {e}")
+        raise
+
+class TournamentStream:
+    """Read a filtered tournament result set a batch at a time.
+
+    Rows come off a server-side cursor on a dedicated connection, so memory
+    stays flat however many rows match. The connection is not tied to a
+    thread: batches may be fetched from any pool thread, and close() waits
+    for an in-flight fetch before releasing it. Iterating yields single rows.
+    """
+
+    def __init__(self, sport: Optional[str] = None, level: Optional[str] = None,
+                 fields: Optional[List[str]] = None,
+                 start_from: Optional[str] = None, start_to: Optional[str] = None,
+                 end_from: Optional[str] = None, end_to: Optional[str] = None,
+                 batch_size: int = STREAM_BATCH_SIZE):
+        columns = _select_fields(fields)
+        where, params = _filter_clause(sport, level, start_from, start_to, end_from, end_to)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = open_connection(check_same_thread=False)
+        try:
+            self._cursor = self._conn.execute(
+                f"SELECT {columns} FROM tournaments{where} ORDER BY start_date ASC, id ASC", params
+            )
+        except Exception as e:
+            logger.error(f"Error opening tournament stream: {e}")
+            self._conn.close()
+            raise
+
+    def next_batch(self) -> List[Dict]:
+        with self._lock:
+            if self._cursor is None:
+                return []
+            rows = self._cursor.fetchmany(self.batch_size)
+        return [_row_to_dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._cursor = None
+                self._conn.close()
+                self._conn = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        while True:
+            batch = self.next_batch()
+            if not batch:
+                return
+            yield from batch
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def _fts_query(text: str) -> str:
+    # Quote each word so user input can't inject FTS5 syntax; '*' allows prefix matches.
+    return " ".join(f'"{token}"*' for token in re.findall(r"\w+", text))
+
+def search_tournaments(query: str, sport: Optional[str] = None, level: Optional[str] = None,
+                       start_from: Optional[str] = None, start_to: Optional[str] = None,
+                       limit: int = 50, fields: Optional[List[str]] = None) -> List[Dict]:
+    match = _fts_query(query)
+    if not match:
         return []
-    finally:
-        conn.close()
+    
+    columns = _select_fields(fields)
+    columns = "t.*" if columns == "*" else ", ".join(f"t.{column}" for column in columns.split(", "))
+    where, params = _filter_clause(sport, level, start_from, start_to)
+    
+    try:
+        conn = get_connection()
+        rows = conn.execute(f"""
+            SELECT {columns} FROM tournaments_fts
+            JOIN tournaments t ON t.id = tournaments_fts.rowid
+            {where} AND tournaments_fts MATCH ?
+            ORDER BY bm25(tournaments_fts, 10.0, 1.0)
+            LIMIT ?
+        """, params + [match, limit]).fetchall()
+        
+        return [_row_to_dict(row) for row in rows]
+        
+    except Exception as e:
+        logger.error(f"Error searching tournaments: {e}")
+        raise
 
 def get_tournament_stats() -> Dict:
     try:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("SELECT COUNT(*) as total FROM tournaments")
-        total = cursor.fetchone()['total']
+        # tournament_counts is kept exact by triggers and holds at most one row per
+        # (sport, level, month), so this does not grow with the tournaments table.
+        cursor.execute("SELECT sport, level, month, count FROM tournament_counts")
         
-        cursor.execute("SELECT sport, COUNT(*) as count FROM tournaments GROUP BY sport")
-        sport_stats = {row['sport']: row['count'] for row in cursor.fetchall()}
+        total = 0
+        sport_stats = {}
+        level_stats = {}
+        sport_level_stats = {}
+        monthly_stats = {}
         
-        cursor.execute("SELECT level, COUNT(*) as count FROM tournaments GROUP BY level")
-        level_stats = {row['level']: row['count'] for row in cursor.fetchall()}
+        for row in cursor.fetchall():
+            sport, level, month, count = row['sport'], row['level'], row['month'], row['count']
+            total += count
+            sport_stats[sport] = sport_stats.get(sport, 0) + count
+            level_stats[level] = level_stats.get(level, 0) + count
+            sport_level_stats.setdefault(sport, {})
+            sport_level_stats[sport][level] = sport_level_stats[sport].get(level, 0) + count
+            monthly_stats[month] = monthly_stats.get(month, 0) + count
         
         return {
             'total_tournaments': total,
             'sport_distribution': sport_stats,
-            'level_distribution': level_stats
+            'level_distribution': level_stats,
+            'sport_level_distribution': sport_level_stats,
+            'monthly_distribution': dict(sorted(monthly_stats.items()))
         }
         
     except Exception as e:
         logger.error(f"Error fetching tournament stats: {e}")
-        return {}
-    finally:
-        conn.close()
+        raise
 
 def clear_tournaments():
     try:
@@ -178,11 +760,50 @@ def clear_tournaments():
         cursor = conn.cursor()
         
         cursor.execute("DELETE FROM tournaments")
+        _bump_data_version(cursor)
         conn.commit()
         logger.info("All tournaments cleared from database")
         
     except Exception as e:
+        rollback()
         logger.error(f"Error clearing tournaments: {e}")
         raise
-    finally:
-        conn.close()
+
+def get_streaming_platforms(sport: str, level: str, max_age_days: Optional[int] = None) -> Optional[str]:
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        query = "SELECT platforms FROM streaming_catalog WHERE sport = ? AND level = ?"
+        params = [sport, level]
+        
+        if max_age_days:
+            query += " AND last_updated >= datetime('now', ?)"
+            params.append(f"-{max_age_days} days")
+        
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+        return row['platforms'] if row else None
+        
+    except Exception as e:
+        logger.error(f"Error fetching streaming platforms: {e}")
+        return None
+
+def save_streaming_platforms(sport: str, level: str, platforms: str) -> bool:
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT OR REPLACE INTO streaming_catalog (sport, level, platforms, last_updated)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """, (sport, level, platforms))
+        
+        conn.commit()
+        return True
+        
+    except Exception as e:
+        rollback()
+        logger.error(f"Error saving streaming platforms: {e}")
+        return False
+
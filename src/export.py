@@ -1,83 +1,237 @@
 import csv
+import gzip
 import json
 import logging
+import os
+import re
+import uuid
 from pathlib import Path
-from typing import List, Dict
-from db_utils import get_all_tournaments
+from typing import Callable, Dict, IO, Iterable, List, Optional, Sequence, Tuple, Union
+from db_utils import TournamentStream
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def export_to_csv(filename: str = "tournaments.csv") -> bool:
-    try:
-        tournaments = get_all_tournaments()
-        
-        if not tournaments:
-            logger.warning("No tournaments to export")
-            return False
-        
-        fieldnames = [
-            'Tournament Name', 'Sport', 'Level', 'Start Date', 'End Date',
-            'Tournament Official URL', 'Streaming Partners/Links', 
-            'Tournament Image', 'Summary of Tournament'
-        ]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for tournament in tournaments:
-                writer.writerow({
-                    'Tournament Name': tournament.get('tournament_name', 'N/A'),
-                    'Sport': tournament.get('sport', 'N/A'),
-                    'Level': tournament.get('level', 'N/A'),
-                    'Start Date': tournament.get('start_date', 'N/A'),
-                    'End Date': tournament.get('end_date', 'N/A'),
-                    'Tournament Official URL': tournament.get('tournament_url', 'N/A'),
-                    'Streaming Partners/Links': tournament.get('streaming_links', 'N/A'),
-                    'Tournament Image': tournament.get('tournament_image', 'N/A'),
-                    'Summary of Tournament': tournament.get('summary', 'N/A')
-                })
+EXPORT_FIELDNAMES = [
+    'Tournament Name', 'Sport', 'Level', 'Start Date', 'End Date',
+    'Tournament Official URL', 'Streaming Partners/Links', 
+    'Tournament Image', 'Summary of Tournament'
+]
+
+PARTITION_COLUMNS = ('sport', 'level')
+
+def _export_row(tournament: Dict) -> Dict:
+    return {
+        'Tournament Name': tournament.get('tournament_name', 'N/A'),
+        'Sport': tournament.get('sport', 'N/A'),
+        'Level': tournament.get('level', 'N/A'),
+        'Start Date': tournament.get('start_date', 'N/A'),
+        'End Date': tournament.get('end_date', 'N/A'),
+        'Tournament Official URL': tournament.get('tournament_url', 'N/A'),
+        'Streaming Partners/Links': tournament.get('streaming_links', 'N/A'),
+        'Tournament Image': tournament.get('tournament_image', 'N/A'),
+        'Summary of Tournament': tournament.get('summary', 'N/A')
+    }
+
+def _open_output(filename: str, compress: bool = False, newline: str = None) -> IO[str]:
+    if compress:
+        return gzip.open(filename, 'wt', encoding='utf-8', newline=newline)
+    return open(filename, 'w', encoding='utf-8', newline=newline)
+
+class _CsvWriter:
+    newline = ''
+    
+    def __init__(self, outfile: IO[str]):
+        self._writer = csv.DictWriter(outfile, fieldnames=EXPORT_FIELDNAMES)
+        self._writer.writeheader()
+    
+    def write(self, row: Dict):
+        self._writer.writerow(row)
+    
+    def finish(self):
+        pass
+
+class _JsonWriter:
+    # Element by element, byte-identical to json.dump(rows, indent=2, ensure_ascii=False).
+    newline = None
+    
+    def __init__(self, outfile: IO[str]):
+        self._outfile = outfile
+        self._empty = True
+        outfile.write('[')
+    
+    def write(self, row: Dict):
+        self._outfile.write('\n' if self._empty else ',\n')
+        # json.dumps escapes newlines inside strings, so every newline here is structural.
+        self._outfile.write('  ' + json.dumps(row, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        self._empty = False
+    
+    def finish(self):
+        self._outfile.write(']' if self._empty else '\n]')
+
+class _NdjsonWriter:
+    newline = None
+    
+    def __init__(self, outfile: IO[str]):
+        self._outfile = outfile
+    
+    def write(self, row: Dict):
+        self._outfile.write(json.dumps(row, ensure_ascii=False))
+        self._outfile.write('\n')
+    
+    def finish(self):
+        pass
+
+EXPORT_FORMATS = {
+    'csv': _CsvWriter,
+    'json': _JsonWriter,
+    'ndjson': _NdjsonWriter,
+}
+
+class _ExportFile:
+    """One output file, written to a temp file beside it and renamed into place on commit.
+
+    Readers of the target path only ever see the previous export or the
+    complete new one, never a half-written file.
+    """
+    
+    def __init__(self, path: Path, format: str, compress: bool = False):
+        writer_class = EXPORT_FORMATS[format]
+        if compress and path.suffix != '.gz':
+            path = path.with_name(path.name + '.gz')
+        self.path = path
+        self.count = 0
         
-        logger.info(f"Exported {len(tournaments)} tournaments to {filename}")
-        return True
+        # Opened like any other output (not mkstemp) so the file keeps the usual umask permissions.
+        self._tmp_path = str(path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp"))
+        self._outfile = None
+        try:
+            self._outfile = _open_output(self._tmp_path, compress, writer_class.newline)
+            self._writer = writer_class(self._outfile)
+        except Exception:
+            self.discard()
+            raise
+    
+    def write(self, row: Dict):
+        self._writer.write(row)
+        self.count += 1
+    
+    def commit(self):
+        self._writer.finish()
+        self._outfile.close()
+        os.replace(self._tmp_path, self.path)
+    
+    def discard(self):
+        if self._outfile is not None:
+            self._outfile.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+def _partition_suffix(tournament: Dict, partition_by: Sequence[str]) -> str:
+    parts = []
+    for column in partition_by:
+        value = re.sub(r'[^A-Za-z0-9]+', '_', str(tournament.get(column) or '')).strip('_')
+        parts.append(value or 'unknown')
+    return '_'.join(parts)
+
+def _run_export(tournaments: Iterable[Dict], route: Callable[[Dict], Iterable[Tuple[Path, str]]],
+                compress: bool = False) -> Dict[str, int]:
+    # Each row is converted once and handed to every (path, format) the route names for it.
+    files: Dict[Tuple[Path, str], _ExportFile] = {}
+    try:
+        for tournament in tournaments:
+            row = _export_row(tournament)
+            for target in route(tournament):
+                export_file = files.get(target)
+                if export_file is None:
+                    export_file = files[target] = _ExportFile(*target, compress=compress)
+                export_file.write(row)
+    except BaseException:
+        for export_file in files.values():
+            export_file.discard()
+        raise
+    
+    written = {}
+    for export_file in files.values():
+        export_file.commit()
+        written[str(export_file.path)] = export_file.count
+        logger.info(f"Exported {export_file.count} tournaments to {export_file.path}")
+    return written
+
+def export_tournaments(directory: Union[str, Path] = ".", basename: str = "tournaments",
+                       formats: Sequence[str] = ('csv', 'json', 'ndjson'),
+                       sport: Optional[str] = None, level: Optional[str] = None,
+                       partition_by: Sequence[str] = (), compress: bool = False,
+                       start_from: Optional[str] = None, start_to: Optional[str] = None,
+                       end_from: Optional[str] = None, end_to: Optional[str] = None) -> Dict[str, int]:
+    """Export the filtered tournaments to every format in one scan of the table.
+
+    Each format gets `<basename>.<format>` in `directory`. With partition_by
+    (any of 'sport', 'level') the same scan also writes one file per
+    partition value, e.g. `<basename>_Cricket_National.csv`. Files are
+    committed together once the scan finishes; if it fails, none are.
+
+    Returns the number of rows written to each file, keyed by path; an
+    empty dict means no tournaments matched and nothing was written.
+    """
+    formats = [format.lower() for format in formats]
+    for format in formats:
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+    for column in partition_by:
+        if column not in PARTITION_COLUMNS:
+            raise ValueError(f"Cannot partition by {column}; expected one of {', '.join(PARTITION_COLUMNS)}")
+    
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    
+    def route(tournament: Dict) -> List[Tuple[Path, str]]:
+        names = [basename]
+        if partition_by:
+            names.append(f"{basename}_{_partition_suffix(tournament, partition_by)}")
+        return [(directory / f"{name}.{format}", format) for name in names for format in formats]
+    
+    with TournamentStream(sport=sport, level=level, start_from=start_from, start_to=start_to,
+                          end_from=end_from, end_to=end_to) as stream:
+        written = _run_export(stream, route, compress)
+    
+    if not written:
+        logger.warning("No tournaments to export")
+    return written
+
+def _stream_export(filename: str, format: str, compress: bool = False) -> bool:
+    target = [(Path(filename), format)]
+    with TournamentStream() as stream:
+        written = _run_export(stream, lambda tournament: target, compress)
+    
+    if not written:
+        logger.warning("No tournaments to export")
+    return bool(written)
+
+def export_to_csv(filename: str = "tournaments.csv", compress: bool = False) -> bool:
+    try:
+        return _stream_export(filename, 'csv', compress)
         
     except Exception as e:
         logger.error(f"Error exporting to CSV: {e}")
         return False
 
-def export_to_json(filename: str = "tournaments.json") -> bool:
+def export_to_json(filename: str = "tournaments.json", compress: bool = False) -> bool:
     try:
-        tournaments = get_all_tournaments()
-        
-        if not tournaments:
-            logger.warning("No tournaments to export")
-            return False
-        
-        export_data = []
-        for tournament in tournaments:
-            export_data.append({
-                'Tournament Name': tournament.get('tournament_name', 'N/A'),
-                'Sport': tournament.get('sport', 'N/A'),
-                'Level': tournament.get('level', 'N/A'),
-                'Start Date': tournament.get('start_date', 'N/A'),
-                'End Date': tournament.get('end_date', 'N/A'),
-                'Tournament Official URL': tournament.get('tournament_url', 'N/A'),
-                'Streaming Partners/Links': tournament.get('streaming_links', 'N/A'),
-                'Tournament Image': tournament.get('tournament_image', 'N/A'),
-                'Summary of Tournament': tournament.get('summary', 'N/A')
-            })
-        
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Exported {len(tournaments)} tournaments to {filename}")
-        return True
+        return _stream_export(filename, 'json', compress)
         
     except Exception as e:
         logger.error(f"Error exporting to JSON: {e}")
         return False
 
+def export_to_ndjson(filename: str = "tournaments.ndjson", compress: bool = False) -> bool:
+    try:
+        return _stream_export(filename, 'ndjson', compress)
+        
+    except Exception as e:
+        logger.error(f"Error exporting to NDJSON: {e}")
+        return False
+
 def create_sample_files():
     try:
         sample_tournaments = [
@@ -123,12 +277,7 @@ def create_sample_files():
         json_file = exports_dir / "sample.json"
         
         with open(csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Tournament Name', 'Sport', 'Level', 'Start Date', 'End Date',
-                'Tournament Official URL', 'Streaming Partners/Links', 
-                'Tournament Image', 'Summary of Tournament'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=EXPORT_FIELDNAMES)
             writer.writeheader()
             writer.writerows(sample_tournaments)
         
@@ -142,28 +291,19 @@ def create_sample_files():
         logger.error(f"Error creating sample files: {e}")
         return False
 
-def export_filtered_data(sport: str = None, level: str = None, format: str = "csv") -> bool:
+def export_filtered_data(sport: str = None, level: str = None, format: Union[str, Sequence[str]] = "csv",
+                         partition_by: Sequence[str] = (), compress: bool = False) -> bool:
     try:
-        from db_utils import get_tournaments_by_filter
-        
-        tournaments = get_tournaments_by_filter(sport=sport, level=level)
+        formats = format.split(',') if isinstance(format, str) else format
+        written = export_tournaments(
+            "exports", f"tournaments_{sport or 'all'}_{level or 'all'}", formats,
+            sport=sport, level=level, partition_by=partition_by, compress=compress
+        )
         
-        if not tournaments:
+        if not written:
             logger.warning("No tournaments found with the specified filters")
             return False
-        
-        exports_dir = Path("exports")
-        exports_dir.mkdir(exist_ok=True)
-        
-        if format.lower() == "csv":
-            filename = exports_dir / f"tournaments_{sport or 'all'}_{level or 'all'}.csv"
-            return export_to_csv(str(filename))
-        elif format.lower() == "json":
-            filename = exports_dir / f"tournaments_{sport or 'all'}_{level or 'all'}.json"
-            return export_to_json(str(filename))
-        else:
-            logger.error(f"Unsupported format: {format}")
-            return False
+        return True
             
     except Exception as e:
         logger.error(f"Error exporting filtered data: {e}")
@@ -0,0 +1,224 @@
+import sqlite3
+import json
+import logging
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_PATH = Path(os.getenv('HTTP_CACHE_PATH', 'data/http_cache.db'))
+HTTP_CACHE_MIN_FRESH_SECONDS = int(os.getenv('HTTP_CACHE_MIN_FRESH_SECONDS', '3600'))
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv('HTTP_CACHE_MAX_ENTRIES', '10000'))
+CACHEABLE_STATUS_CODES = (200, 203, 300, 301, 404, 410)
+EVICTION_INTERVAL = 100
+# requests has already decoded the body, so these no longer describe what is stored;
+# the rest are hop-by-hop and only ever describe the connection they arrived on
+UNSTORED_HEADERS = (
+    'Content-Encoding', 'Content-Length', 'Transfer-Encoding', 'Connection',
+    'Keep-Alive', 'Proxy-Authenticate', 'Proxy-Authorization', 'TE', 'Trailer', 'Upgrade'
+)
+_UNSTORED = {header.lower() for header in UNSTORED_HEADERS}
+
+def storable_headers(headers: Dict) -> Dict:
+    return {name: value for name, value in headers.items() if name.lower() not in _UNSTORED}
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+class HTTPCache:
+
+    def __init__(self, path: Path = HTTP_CACHE_PATH, max_entries: int = HTTP_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_stored_at ON http_cache(stored_at)")
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT status_code, headers, body, stored_at FROM http_cache WHERE url = ?", (url,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading HTTP cache: {e}")
+            return None
+
+        if row is None:
+            return None
+        return {
+            'status_code': row[0],
+            'headers': json.loads(row[1]),
+            'body': row[2],
+            'stored_at': row[3]
+        }
+
+    def set(self, url: str, status_code: int, headers: Dict, body: bytes, stored_at: Optional[float] = None):
+        stored_headers = storable_headers(headers)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, status_code, headers, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, status_code, json.dumps(stored_headers), body, stored_at or time.time())
+                )
+                self._writes += 1
+                if self.max_entries and self._writes % EVICTION_INTERVAL == 0:
+                    self._conn.execute("""
+                        DELETE FROM http_cache WHERE url IN (
+                            SELECT url FROM http_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?
+                        )
+                    """, (self.max_entries,))
+                self._conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error writing HTTP cache: {e}")
+
+    def delete(self, url: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache WHERE url = ?", (url,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that serves GET requests from an on-disk cache.
+
+    Freshness follows Cache-Control max-age / Expires, extended to at least
+    ``min_fresh_seconds`` unless the response says no-cache. Stale entries
+    with an ETag or Last-Modified are revalidated with a conditional request.
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None,
+                 min_fresh_seconds: int = HTTP_CACHE_MIN_FRESH_SECONDS, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache or HTTPCache()
+        self.min_fresh_seconds = min_fresh_seconds
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._stats_lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        entry = self.cache.get(request.url)
+
+        if entry is not None:
+            if self._is_fresh(entry):
+                self._count('hits')
+                return self._build_response(request, entry)
+
+            headers = CaseInsensitiveDict(entry['headers'])
+            if headers.get('ETag'):
+                request.headers['If-None-Match'] = headers['ETag']
+            if headers.get('Last-Modified'):
+                request.headers['If-Modified-Since'] = headers['Last-Modified']
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidated')
+            headers = CaseInsensitiveDict(entry['headers'])
+            # A 304 refreshes the entry's metadata, but its framing headers describe an empty body
+            headers.update(storable_headers(response.headers))
+            entry['headers'] = storable_headers(headers)
+            entry['stored_at'] = time.time()
+            self.cache.set(request.url, entry['status_code'], entry['headers'], entry['body'], entry['stored_at'])
+            response.close()
+            return self._build_response(request, entry)
+
+        self._count('misses')
+        if self._is_storable(response):
+            self.cache.set(request.url, response.status_code, response.headers, response.content)
+        elif entry is not None:
+            self.cache.delete(request.url)
+
+        return response
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _is_storable(self, response) -> bool:
+        if response.status_code not in CACHEABLE_STATUS_CODES:
+            return False
+        return 'no-store' not in parse_cache_control(response.headers.get('Cache-Control'))
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        headers = CaseInsensitiveDict(entry['headers'])
+        directives = parse_cache_control(headers.get('Cache-Control'))
+
+        if 'no-cache' in directives or 'no-store' in directives:
+            return False
+
+        lifetime = 0
+        try:
+            if directives.get('max-age') is not None:
+                lifetime = int(directives['max-age'])
+            elif headers.get('Expires') and headers.get('Date'):
+                expires = parsedate_to_datetime(headers['Expires'])
+                date = parsedate_to_datetime(headers['Date'])
+                lifetime = (expires - date).total_seconds()
+        except (TypeError, ValueError):
+            lifetime = 0
+
+        try:
+            age = int(headers.get('Age', 0))
+        except ValueError:
+            age = 0
+
+        return time.time() - entry['stored_at'] + age < max(lifetime, self.min_fresh_seconds)
+
+    def _build_response(self, request, entry: Dict) -> Response:
+        response = Response()
+        response.status_code = entry['status_code']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry['body']
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
+
+    def stats(self) -> Dict:
+        total = self.hits + self.revalidated + self.misses
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.revalidated) / total if total else 0.0
+        }
@@ -0,0 +1,279 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from db_utils import close_connection, get_connection
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAX_JOB_HISTORY = 20
+JOB_SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv('JOB_SHUTDOWN_TIMEOUT_SECONDS', '30'))
+JOB_HEARTBEAT_SECONDS = float(os.getenv('JOB_HEARTBEAT_SECONDS', '2'))
+JOB_STALE_SECONDS = float(os.getenv('JOB_STALE_SECONDS', '30'))
+
+# idx_refresh_jobs_active allows at most one row matching this, across every API worker.
+ACTIVE = "status IN ('queued', 'running')"
+
+class JobAlreadyRunningError(RuntimeError):
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Refresh job {job_id} is already running")
+        self.job_id = job_id
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+class RefreshJob:
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = 'queued'
+        self.created_at = _now()
+        self.started_at = None
+        self.finished_at = None
+        self.collected = 0
+        self.ingest = {}
+        self.errors = []
+        self.cancel_event = threading.Event()
+        self._progress = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ('queued', 'running')
+
+    def update_progress(self, sport: str, level: str, status: str, count: int = 0, error: Optional[str] = None):
+        with self._lock:
+            self._progress[(sport, level)] = {
+                'sport': sport,
+                'level': level,
+                'status': status,
+                'count': count,
+                'error': error
+            }
+            if status == 'done':
+                self.collected += count
+            elif status == 'error':
+                self.errors.append(f"{sport} / {level}: {error}")
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'RefreshJob':
+        # Snapshot of a job as last saved, possibly by another worker process.
+        job = cls()
+        job.id = row['id']
+        job.status = row['status']
+        job.created_at = row['created_at']
+        job.started_at = row['started_at']
+        job.finished_at = row['finished_at']
+        job.collected = row['collected']
+        job.ingest = json.loads(row['ingest'])
+        job.errors = json.loads(row['errors'])
+        for entry in json.loads(row['progress']):
+            job._progress[(entry['sport'], entry['level'])] = entry
+        if row['cancel_requested']:
+            job.cancel_event.set()
+        return job
+
+    def row_values(self) -> tuple:
+        with self._lock:
+            return (
+                self.status, self.started_at, self.finished_at, self.collected,
+                json.dumps(self.ingest), json.dumps(self.errors), json.dumps(list(self._progress.values()))
+            )
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            progress = list(self._progress.values())
+            return {
+                'job_id': self.id,
+                'status': self.status,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'cancel_requested': self.cancel_event.is_set(),
+                'combinations_finished': sum(1 for p in progress if p['status'] in ('done', 'error')),
+                'collected': self.collected,
+                'ingest': dict(self.ingest),
+                'errors': list(self.errors),
+                'progress': progress
+            }
+
+class JobManager:
+    """Runs data refreshes on a background thread, one at a time across all API workers.
+
+    Job state lives in the refresh_jobs table so any worker process can start,
+    report on or cancel a refresh. The worker running a job saves its progress
+    and polls for cancellation every ``heartbeat_seconds``; a job whose
+    heartbeat is older than ``stale_seconds`` belonged to a worker that died
+    and is marked failed so a new refresh can start.
+    """
+
+    def __init__(self, max_history: int = MAX_JOB_HISTORY, heartbeat_seconds: float = JOB_HEARTBEAT_SECONDS,
+                 stale_seconds: float = JOB_STALE_SECONDS):
+        self.max_history = max_history
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        # Jobs running in this process; everything else is read from the database.
+        self._jobs = {}
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def start_refresh(self, **collect_kwargs) -> RefreshJob:
+        job = RefreshJob()
+        conn = get_connection()
+        try:
+            with conn:
+                self._expire_stale(conn)
+                conn.execute(
+                    "INSERT INTO refresh_jobs (id, status, created_at, heartbeat_at) VALUES (?, ?, ?, ?)",
+                    (job.id, job.status, job.created_at, time.time())
+                )
+                conn.execute(
+                    "DELETE FROM refresh_jobs WHERE id NOT IN (SELECT id FROM refresh_jobs ORDER BY created_at DESC LIMIT ?)",
+                    (self.max_history,)
+                )
+        except sqlite3.IntegrityError:
+            active = conn.execute(f"SELECT id FROM refresh_jobs WHERE {ACTIVE}").fetchone()
+            raise JobAlreadyRunningError(active['id'] if active else 'unknown')
+
+        thread = threading.Thread(
+            target=self._run, args=(job, collect_kwargs), name=f"refresh-{job.id[:8]}", daemon=True
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+            self._threads[job.id] = thread
+        thread.start()
+        return job
+
+    def _expire_stale(self, conn: sqlite3.Connection):
+        expired = conn.execute(f"""
+            UPDATE refresh_jobs
+            SET status = 'failed', finished_at = ?,
+                errors = json_insert(errors, '$[#]', 'Worker stopped before the refresh finished')
+            WHERE {ACTIVE} AND heartbeat_at < ?
+        """, (_now(), time.time() - self.stale_seconds)).rowcount
+        if expired:
+            logger.warning("Marked a refresh job abandoned by its worker as failed")
+
+    def _run(self, job: RefreshJob, collect_kwargs: Dict):
+        job.status = 'running'
+        job.started_at = _now()
+        logger.info(f"Refresh job {job.id} started")
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job, finished), name=f"refresh-{job.id[:8]}-heartbeat", daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            from data_collection import TournamentCollector
+
+            collector = TournamentCollector()
+            collector.collect_tournaments(
+                progress=job.update_progress, cancel_event=job.cancel_event, **collect_kwargs
+            )
+            job.ingest = collector.ingest_stats
+            failed = job.ingest.get('failed', 0)
+            if failed:
+                # Progress counted these as collected when they were buffered.
+                job.collected -= failed
+                job.errors.append(f"{failed} collected tournaments could not be saved")
+            job.status = 'cancelled' if job.cancel_event.is_set() else 'completed'
+
+        except Exception as e:
+            logger.error(f"Refresh job {job.id} failed: {e}")
+            job.errors.append(str(e))
+            job.status = 'failed'
+
+        finally:
+            job.finished_at = _now()
+            finished.set()
+            heartbeat.join()
+            with self._lock:
+                self._jobs.pop(job.id, None)
+                self._threads.pop(job.id, None)
+            logger.info(f"Refresh job {job.id} {job.status}")
+
+    def _heartbeat(self, job: RefreshJob, finished: threading.Event):
+        # Saves on its own thread and connection so the collector's transactions are never committed early.
+        try:
+            while True:
+                done = finished.wait(self.heartbeat_seconds)
+                try:
+                    self._save(job)
+                except sqlite3.Error as e:
+                    logger.error(f"Error saving refresh job {job.id}: {e}")
+                if done:
+                    return
+        finally:
+            close_connection()
+
+    def _save(self, job: RefreshJob):
+        conn = get_connection()
+        with conn:
+            saved = conn.execute(f"""
+                UPDATE refresh_jobs
+                SET status = ?, started_at = ?, finished_at = ?, collected = ?, ingest = ?, errors = ?,
+                    progress = ?, heartbeat_at = ?
+                WHERE id = ? AND {ACTIVE}
+            """, job.row_values() + (time.time(), job.id)).rowcount
+            row = conn.execute("SELECT cancel_requested FROM refresh_jobs WHERE id = ?", (job.id,)).fetchone()
+
+        if not saved and job.is_active:
+            # Another worker gave up on this job; stop rather than run alongside its replacement.
+            logger.warning(f"Refresh job {job.id} was taken over; cancelling")
+            job.cancel_event.set()
+        elif row is not None and row['cancel_requested']:
+            job.cancel_event.set()
+
+    def get(self, job_id: str) -> Optional[RefreshJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        row = get_connection().execute("SELECT * FROM refresh_jobs WHERE id = ?", (job_id,)).fetchone()
+        return RefreshJob.from_row(row) if row is not None else None
+
+    def list(self) -> List[RefreshJob]:
+        rows = get_connection().execute("SELECT * FROM refresh_jobs ORDER BY created_at").fetchall()
+        with self._lock:
+            return [self._jobs.get(row['id']) or RefreshJob.from_row(row) for row in rows]
+
+    def cancel(self, job_id: str) -> Optional[RefreshJob]:
+        # The worker running the job picks this up on its next heartbeat.
+        conn = get_connection()
+        with conn:
+            conn.execute(f"UPDATE refresh_jobs SET cancel_requested = 1 WHERE id = ? AND {ACTIVE}", (job_id,))
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            job.cancel_event.set()
+        return self.get(job_id)
+
+    def shutdown(self, timeout: float = JOB_SHUTDOWN_TIMEOUT_SECONDS):
+        """Cancel running refreshes and wait for them to wind down.
+
+        Cancelling lets the collector leave its loops normally, so its
+        TournamentWriter flushes buffered rows and the job records its final
+        status. A job still running after ``timeout`` seconds is abandoned.
+        """
+        with self._lock:
+            running = [(self._jobs.get(job_id), thread) for job_id, thread in self._threads.items()]
+
+        deadline = time.monotonic() + timeout
+        for job, thread in running:
+            if job is not None:
+                job.cancel_event.set()
+        for job, thread in running:
+            thread.join(max(deadline - time.monotonic(), 0))
+            if thread.is_alive():
+                logger.warning(f"Refresh job {job.id if job else thread.name} still running at shutdown")
@@ -0,0 +1,84 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+READ_CACHE_MAX_ENTRIES = int(os.getenv('READ_CACHE_MAX_ENTRIES', '256'))
+READ_CACHE_MAX_ROWS = int(os.getenv('READ_CACHE_MAX_ROWS', '50000'))
+
+def _weight(value: Any) -> int:
+    if isinstance(value, list):
+        return max(len(value), 1)
+    if isinstance(value, dict) and isinstance(value.get('tournaments'), list):
+        return max(len(value['tournaments']), 1)
+    return 1
+
+class VersionedCache:
+    """In-process LRU cache for query results, tied to the database data version.
+
+    Every write path bumps the data version, and the first lookup that sees a
+    newer version drops all entries. Size is bounded by entry count and by the
+    total number of cached rows.
+    """
+
+    def __init__(self, max_entries: int = READ_CACHE_MAX_ENTRIES, max_rows: int = READ_CACHE_MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        self._rows = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, version: int, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._entries.clear()
+                self._rows = 0
+                self._version = version
+
+            # A request that read its version before a concurrent write is served uncached:
+            # moving the cache back would thrash it and file newer rows under the old version.
+            if version == self._version and key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+
+            self.misses += 1
+
+        value = loader()
+        weight = _weight(value)
+
+        with self._lock:
+            if version != self._version or weight > self.max_rows or key in self._entries:
+                return value
+
+            self._entries[key] = (value, weight)
+            self._rows += weight
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self._rows -= evicted_weight
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries),
+                'rows': self._rows,
+                'data_version': self._version
+            }